@@ -495,6 +495,8 @@ class ModuleWindow(QMainWindow):
         # Save current progress
         if self.training_module:
             self.save_current_progress()
+            # The module is a child widget and never gets a closeEvent of its own
+            self.training_module.shutdown()
         
         # Emit signal that module was closed
         self.module_closed.emit()
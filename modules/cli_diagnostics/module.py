@@ -5,9 +5,12 @@ Interactive module for teaching network diagnostic commands
 """
 
 import os
-import subprocess
 import re
+import shlex
+import shutil
+from collections import deque
 from datetime import datetime
+from html import escape
 from pathlib import Path
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
@@ -15,45 +18,35 @@ from PySide6.QtWidgets import (
     QTableWidget, QTableWidgetItem, QHeaderView, QSplitter,
     QComboBox, QSpinBox
 )
-from PySide6.QtCore import Qt, QTimer, Signal, QThread
-from PySide6.QtGui import QFont, QColor, QTextCharFormat, QTextCursor
+from PySide6.QtCore import Qt, QTimer, QProcess
+from PySide6.QtGui import QFont, QTextCharFormat, QTextCursor
 from training_module import TrainingModule
 
-class CommandExecutor(QThread):
-    """Thread for executing commands without blocking UI"""
-    output_ready = Signal(str)
-    error_occurred = Signal(str)
-    execution_complete = Signal()
-    
-    def __init__(self, command):
-        super().__init__()
-        self.command = command
-        
-    def run(self):
-        try:
-            process = subprocess.Popen(
-                self.command,
-                shell=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            
-            # Read output in real-time
-            for line in process.stdout:
-                self.output_ready.emit(line.strip())
-            
-            # Get any errors
-            stderr = process.stderr.read()
-            if stderr:
-                self.error_occurred.emit(stderr)
-            
-            process.wait()
-            self.execution_complete.emit()
-            
-        except Exception as e:
-            self.error_occurred.emit(str(e))
-            self.execution_complete.emit()
+# Diagnostic binaries are resolved once at import; ping's count flag differs by platform
+_PING = shutil.which("ping") or "ping"
+_PING_COUNT_FLAG = "-n" if os.name == "nt" else "-c"
+_PING_DEFAULT_COUNT = 4
+_IPCONFIG = shutil.which("ipconfig") or "ipconfig"
+_ARP = shutil.which("arp") or "arp"
+_TRACE = shutil.which("tracert") or shutil.which("traceroute") or "tracert"
+_COMMAND_PATHS = {
+    "ping": _PING,
+    "ipconfig": _IPCONFIG,
+    "arp": _ARP,
+    "tracert": _TRACE,
+}
+# On Windows typed commands go through cmd.exe so built-ins and quoting behave as at a prompt
+_COMSPEC = os.environ.get("COMSPEC", "cmd.exe")
+
+# Matches the ping reply lines that update the network log status
+_PING_STATUS_RE = re.compile(
+    r'Reply from ([\d.]+).*?time=(\d+)ms|Request timed out|Destination host unreachable'
+)
+
+# Error output is appended as pre-styled HTML; plain output uses the default format
+_ERR_PREFIX = '<span style="color:#ff5555;white-space:pre">'
+_ERR_SUFFIX = '</span>'
+_OUTPUT_FORMAT = QTextCharFormat()
 
 class CLIDiagnosticsModule(TrainingModule):
     """Command Line Interface Diagnostics Training Module"""
@@ -62,8 +55,17 @@ class CLIDiagnosticsModule(TrainingModule):
         self.db_manager = db_manager
         self.command_history = []
         self.network_log = []
+        self.pending_commands = deque()
+        self._stdout_buffer = ""
         super().__init__(module_data, user_data)
         
+        # Index task definitions once so validation avoids rescanning the list
+        self._tasks_by_id = {t['id']: t for t in self.module_data.get('tasks', [])}
+        self._required_verbs = {
+            t['id']: {cmd.split()[0].lower() for cmd in t['commands']}
+            for t in self._tasks_by_id.values() if t.get('commands')
+        }
+        
     def get_learning_objectives(self) -> list:
         return [
             "Master command line interface navigation",
@@ -81,6 +83,13 @@ class CLIDiagnosticsModule(TrainingModule):
         """Setup module-specific UI elements"""
         layout = QVBoxLayout(parent)
         
+        # Single QProcess driven by the Qt event loop for every command
+        self.process = QProcess(self)
+        self.process.readyReadStandardOutput.connect(self.read_process_output)
+        self.process.readyReadStandardError.connect(self.read_process_error)
+        self.process.finished.connect(self.process_finished)
+        self.process.errorOccurred.connect(self.process_error)
+        
         # Command terminal section
         terminal_group = QGroupBox("Command Terminal")
         terminal_layout = QVBoxLayout()
@@ -158,15 +167,19 @@ class CLIDiagnosticsModule(TrainingModule):
         common_buttons_layout = QVBoxLayout()
         
         ipconfig_button = QPushButton("Show IP Configuration")
-        ipconfig_button.clicked.connect(lambda: self.run_command("ipconfig /all"))
+        ipconfig_button.clicked.connect(
+            lambda: self.run_command("ipconfig /all", [_IPCONFIG, "/all"])
+        )
         common_buttons_layout.addWidget(ipconfig_button)
         
         arp_button = QPushButton("Show ARP Table")
-        arp_button.clicked.connect(lambda: self.run_command("arp -a"))
+        arp_button.clicked.connect(lambda: self.run_command("arp -a", [_ARP, "-a"]))
         common_buttons_layout.addWidget(arp_button)
         
         tracert_button = QPushButton("Trace Route to Google")
-        tracert_button.clicked.connect(lambda: self.run_command("tracert google.com"))
+        tracert_button.clicked.connect(
+            lambda: self.run_command("tracert google.com", [_TRACE, "google.com"])
+        )
         common_buttons_layout.addWidget(tracert_button)
         
         quick_cmd_layout.addLayout(common_buttons_layout)
@@ -236,11 +249,12 @@ class CLIDiagnosticsModule(TrainingModule):
             
             if self.continuous_check.isChecked():
                 count = self.ping_count.value()
-                command = f"ping -n {count} {ip_address}"
+                command = f"ping {_PING_COUNT_FLAG} {count} {ip_address}"
             else:
+                count = _PING_DEFAULT_COUNT
                 command = f"ping {ip_address}"
             
-            self.run_command(command)
+            self.run_command(command, [_PING, _PING_COUNT_FLAG, str(count), ip_address])
     
     def execute_command(self):
         """Execute command from input"""
@@ -249,61 +263,124 @@ class CLIDiagnosticsModule(TrainingModule):
             self.run_command(command)
             self.command_input.clear()
     
-    def run_command(self, command):
-        """Run a command and display output"""
+    def run_command(self, command, args=None):
+        """Run a command and display output
+        
+        ``args`` is the argv to execute. Typed commands are handed to cmd.exe
+        as a command line on Windows and split from ``command`` elsewhere.
+        """
         self.output_display.append(f"\n> {command}\n")
         self.command_history.append(command)
         
+        if args is None and os.name == 'nt':
+            args = command
+        elif args is None:
+            try:
+                args = shlex.split(command)
+            except ValueError as e:
+                self.append_error(str(e))
+                return
+            args[0] = _COMMAND_PATHS.get(args[0].lower(), args[0])
+            if shutil.which(args[0]) is None:
+                self.append_error(f"'{args[0]}' is a shell built-in or unknown command; "
+                                  "built-in commands are not supported here.")
+                return
+        
         # Disable execute button during execution
         self.execute_button.setEnabled(False)
         
-        # Create and run command executor thread
-        self.executor = CommandExecutor(command)
-        self.executor.output_ready.connect(self.append_output)
-        self.executor.error_occurred.connect(self.append_error)
-        self.executor.execution_complete.connect(self.command_complete)
-        self.executor.start()
+        # Start now, or wait for the running command to finish
+        if self.process.state() == QProcess.NotRunning:
+            self.start_process(args)
+        else:
+            self.pending_commands.append(args)
         
         # Log the command
         self.add_to_network_log(command)
     
+    def start_process(self, args):
+        """Start an argv list, or a Windows command line string, in the shared QProcess"""
+        self._stdout_buffer = ""
+        if isinstance(args, str):
+            # cmd parses the line itself; /s strips only the outer quotes added here
+            self.process.setProgram(_COMSPEC)
+            self.process.setArguments([])
+            self.process.setNativeArguments(f'/d /s /c "{args}"')
+            self.process.start()
+            return
+        
+        if os.name == 'nt':
+            self.process.setNativeArguments("")
+        self.process.start(args[0], args[1:])
+    
+    def read_process_output(self):
+        """Forward complete stdout lines to the display"""
+        self._stdout_buffer += bytes(self.process.readAllStandardOutput()).decode(errors='replace')
+        *lines, self._stdout_buffer = self._stdout_buffer.split('\n')
+        if lines:
+            self.append_output('\n'.join(line.strip() for line in lines))
+    
+    def read_process_error(self):
+        """Forward stderr output to the display"""
+        text = bytes(self.process.readAllStandardError()).decode(errors='replace')
+        if text:
+            self.append_error(text)
+    
+    def process_finished(self, exit_code=0, exit_status=None):
+        """Flush remaining output and complete the command"""
+        if self._stdout_buffer.strip():
+            self.append_output(self._stdout_buffer.strip())
+        self._stdout_buffer = ""
+        self.command_complete()
+    
+    def process_error(self, error):
+        """Report commands that could not be started"""
+        if error == QProcess.FailedToStart:
+            self.append_error(self.process.errorString())
+            self.command_complete()
+    
+    def shutdown(self):
+        """Stop any running command when the module window closes"""
+        if hasattr(self, 'process'):
+            self.pending_commands.clear()
+            if self.process.state() != QProcess.NotRunning:
+                self.process.kill()
+                self.process.waitForFinished(1000)
+        super().shutdown()
+    
     def append_output(self, text):
-        """Append output to display"""
+        """Append a block of output lines to display"""
         cursor = self.output_display.textCursor()
         cursor.movePosition(QTextCursor.End)
-        cursor.insertText(text + '\n')
+        cursor.insertText(text + '\n', _OUTPUT_FORMAT)
         self.output_display.setTextCursor(cursor)
         
-        # Parse ping results for logging
-        if "Reply from" in text:
-            match = re.search(r'Reply from ([\d.]+).*time=(\d+)ms', text)
-            if match:
-                self.update_last_log_entry("Success", match.group(2) + "ms")
-        elif "Request timed out" in text:
-            self.update_last_log_entry("Timeout", "N/A")
-        elif "Destination host unreachable" in text:
-            self.update_last_log_entry("Unreachable", "N/A")
+        # Parse ping results for logging; the last reply in the block wins
+        status = None
+        for match in _PING_STATUS_RE.finditer(text):
+            if match.group(2):
+                status = ("Success", match.group(2) + "ms")
+            elif match.group(0) == "Request timed out":
+                status = ("Timeout", "N/A")
+            else:
+                status = ("Unreachable", "N/A")
+        
+        if status:
+            self.update_last_log_entry(*status)
     
     def append_error(self, text):
         """Append error to display"""
-        cursor = self.output_display.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        
-        # Set red color for errors
-        format = QTextCharFormat()
-        format.setForeground(QColor("red"))
-        cursor.setCharFormat(format)
-        cursor.insertText(text + '\n')
-        
-        # Reset format
-        format.setForeground(QColor("white"))
-        cursor.setCharFormat(format)
-        self.output_display.setTextCursor(cursor)
+        self.output_display.append(_ERR_PREFIX + escape(text.rstrip('\n')) + _ERR_SUFFIX)
     
     def command_complete(self):
         """Handle command completion"""
-        self.execute_button.setEnabled(True)
         self.output_display.append("\nCommand completed.\n")
+        
+        # Run the next queued command, if any
+        if self.pending_commands:
+            self.start_process(self.pending_commands.popleft())
+        else:
+            self.execute_button.setEnabled(True)
     
     def add_to_network_log(self, command):
         """Add entry to network log"""
@@ -383,8 +460,13 @@ class CLIDiagnosticsModule(TrainingModule):
     
     def clear_network_log(self):
         """Clear the network log"""
-        self.log_table.setRowCount(0)
-        self.network_log.clear()
+        # Suppress repaints while the rows are torn down
+        self.log_table.setUpdatesEnabled(False)
+        try:
+            self.log_table.setRowCount(0)
+            self.network_log.clear()
+        finally:
+            self.log_table.setUpdatesEnabled(True)
     
     def validate_task(self, task_id: str) -> bool:
         """Validate specific task completion"""
@@ -394,7 +476,7 @@ class CLIDiagnosticsModule(TrainingModule):
         
         elif task_id in ["ping_machine_network", "ping_riveter_network", "ping_video_network"]:
             # Check if appropriate ping commands were executed
-            task_config = next((t for t in self.module_data.get('tasks', []) if t['id'] == task_id), None)
+            task_config = self._tasks_by_id.get(task_id)
             if task_config and 'network_targets' in task_config:
                 for target in task_config['network_targets']:
                     if any(target in entry['command'] for entry in self.network_log):
@@ -403,11 +485,13 @@ class CLIDiagnosticsModule(TrainingModule):
         
         elif task_id == "advanced_commands":
             # Check if various commands were executed
-            task_config = next((t for t in self.module_data.get('tasks', []) if t['id'] == task_id), None)
-            if task_config and 'commands' in task_config:
-                executed_commands = [entry['command'].lower() for entry in self.network_log]
-                required_commands = [cmd.split()[0].lower() for cmd in task_config['commands']]
-                return all(any(req in cmd for cmd in executed_commands) for req in required_commands)
+            required_verbs = self._required_verbs.get(task_id)
+            if required_verbs:
+                executed_verbs = {
+                    entry['command'].split()[0].lower()
+                    for entry in self.network_log if entry['command'].split()
+                }
+                return required_verbs.issubset(executed_verbs)
             return False
         
         return True
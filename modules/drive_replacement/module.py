@@ -7,25 +7,198 @@ Interactive module for teaching SSD replacement procedures in Siemens IPCs
 import os
 import subprocess
 from datetime import datetime
+from html import escape
 from pathlib import Path
+from types import MappingProxyType
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QTextEdit, QLineEdit, QMessageBox, QGroupBox, QCheckBox,
     QTableWidget, QTableWidgetItem, QHeaderView, QComboBox,
-    QRadioButton, QButtonGroup, QSpinBox, QListWidget
+    QRadioButton, QButtonGroup, QSpinBox, QListWidget, QTabWidget
 )
 from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtGui import QFont, QPixmap
-from training_module import TrainingModule
+from training_module import TrainingModule, LazySection
+
+# Static simulation text, built once at import instead of on every click
+_REMOVAL_STEPS = (
+    "Case opened with appropriate Torx driver",
+    "Drive bay located",
+    "SATA cables disconnected",
+    "Mounting screws removed",
+    "Drive safely removed"
+)
+_REMOVAL_RESULT = "\n".join(f"✓ {step}" for step in _REMOVAL_STEPS)
+
+# The first installation step names the selected SSD and is added per click
+_INSTALL_STEPS = (
+    "Secured with original Torx screws",
+    "SATA data cable connected (red stripe = pin 1)",
+    "SATA power cable connected",
+    "Cables properly routed and secured"
+)
+_INSTALL_TAIL = "\n".join(f"✓ {step}" for step in _INSTALL_STEPS)
+
+_BIOS_INFO_TEMPLATE = """
+BIOS Detection Results:
+✓ New SSD detected: {ssd}
+✓ SATA mode: AHCI
+✓ Boot order: Correct
+✓ Secure Boot: Disabled
+✓ Fast Boot: Enabled
+        """
+
+_TEST_RESULTS = """
+Functionality Test Results:
+✓ Windows booted successfully
+✓ All devices recognized
+✓ Network connectivity verified
+✓ Machine control software operational
+✓ Performance within specifications
+        """
+
+_BENCHMARK_RESULTS = """
+Performance Benchmark Results:
+
+Sequential Read: 550 MB/s
+Sequential Write: 520 MB/s
+Random Read (4K): 95,000 IOPS
+Random Write (4K): 88,000 IOPS
+
+Old HDD Performance:
+Sequential Read: 120 MB/s
+Sequential Write: 110 MB/s
+
+Improvement: 458% faster
+        """
+
+_OPTIMIZATIONS = """
+SSD Optimizations Applied:
+✓ TRIM enabled
+✓ Superfetch disabled
+✓ Prefetch disabled
+✓ Write caching enabled
+✓ Power management optimized
+✓ Partition alignment verified
+        """
+
+_TROUBLESHOOTING_GUIDES = MappingProxyType({
+    "Drive not detected in BIOS": """
+1. Verify power connection
+2. Check SATA cable orientation
+3. Try different SATA port
+4. Update BIOS firmware
+5. Test with different SATA cable
+            """,
+    "Boot failure after installation": """
+1. Check boot order in BIOS
+2. Verify AHCI mode enabled
+3. Rebuild BCD:
+   bootrec /fixmbr
+   bootrec /fixboot
+   bootrec /rebuildbcd
+4. Check for secure boot conflicts
+            """,
+    "Poor performance": """
+1. Enable AHCI (not IDE mode)
+2. Verify SATA port speed
+3. Align SSD partitions
+4. Update SSD firmware
+5. Check for background processes
+            """,
+    "SMART errors": """
+1. Check drive health utility
+2. Backup data immediately
+3. Run manufacturer diagnostics
+4. Consider warranty replacement
+5. Monitor temperature
+            """,
+    "Connection issues": """
+1. Reseat all connections
+2. Check cable integrity
+3. Try different SATA port
+4. Verify power cable connection
+5. Test with known good cables
+            """
+})
+
+_RESOURCES = MappingProxyType({
+    "documents": (
+        {
+            "title": "Drive Replacement Guide",
+            "path": "resources/drive_replacement_guide.md",
+            "type": "markdown"
+        },
+    ),
+    "links": (
+        {
+            "title": "SSD Optimization Guide",
+            "url": "https://docs.microsoft.com/en-us/windows-hardware/drivers/storage/nvm-express",
+            "description": "Microsoft NVMe and SSD optimization documentation"
+        },
+    ),
+    "tips": (
+        "Always ground yourself before handling components",
+        "Handle drives by edges only",
+        "Never force connections",
+        "Keep original screws organized",
+        "Document cable routing with photos",
+        "Test drive before final assembly"
+    ),
+    "torx_sizes": MappingProxyType({
+        "T8": "Smallest screws",
+        "T10": "Drive mounting screws",
+        "T15": "Case screws",
+        "T20": "Larger case screws"
+    })
+})
+
+# Tasks completed by running the matching installation process step
+_STEP_TASKS = frozenset({
+    "drive_removal",
+    "ssd_installation",
+    "bios_verification",
+    "system_restoration",
+    "post_installation_testing"
+})
 
 class DriveReplacementModule(TrainingModule):
     """Hard Drive Replacement Training Module"""
     
+    # Shared by every instance; created on first use since QFont needs a QGuiApplication
+    _STEP_LABEL_FONT = None
+    
+    @classmethod
+    def _step_label_font(cls):
+        """Return the shared font for the current step label"""
+        if cls._STEP_LABEL_FONT is None:
+            cls._STEP_LABEL_FONT = QFont("Arial", 12, QFont.Bold)
+        return cls._STEP_LABEL_FONT
+    
+    _TOOLS = (
+        ('torx_t8', "Torx T8 driver"),
+        ('torx_t10', "Torx T10 driver"),
+        ('torx_t15', "Torx T15 driver"),
+        ('torx_t20', "Torx T20 driver"),
+        ('anti_static', "Anti-static wrist strap"),
+        ('cable_ties', "Cable ties/velcro"),
+        ('camera', "Camera for documentation")
+    )
+    
+    _SAFETY = (
+        ('power_off', "Power system off"),
+        ('disconnect_ac', "Disconnect AC power"),
+        ('discharge', "Press power button 10 seconds"),
+        ('wait_30', "Wait 30 seconds"),
+        ('grounded', "Properly grounded")
+    )
+    
     def __init__(self, module_data, user_data, db_manager=None):
         self.db_manager = db_manager
         self.documentation = {}
         self.hardware_checklist = []
         self.performance_results = {}
+        self._completed_steps = set()
         super().__init__(module_data, user_data)
         
     def get_learning_objectives(self) -> list:
@@ -43,9 +216,32 @@ class DriveReplacementModule(TrainingModule):
         
     def setup_custom_ui(self, parent):
         """Setup module-specific UI elements"""
+        # Build with updates frozen so the parent lays out and paints once
+        parent.setUpdatesEnabled(False)
+        try:
+            self._build_custom_ui(parent)
+        finally:
+            parent.setUpdatesEnabled(True)
+            parent.updateGeometry()
+    
+    def _build_custom_ui(self, parent):
+        """Create the module-specific widgets"""
         layout = QVBoxLayout(parent)
         
-        # Documentation section
+        self._build_doc_section(layout)
+        self._build_hardware_section(layout)
+        self._build_drive_section(layout)
+        self._build_install_section(layout)
+        
+        # Performance and troubleshooting share a tab widget; each page is
+        # built the first time its tab is shown
+        extras_tabs = QTabWidget()
+        extras_tabs.addTab(LazySection(self._build_perf_section), "Performance Testing")
+        extras_tabs.addTab(LazySection(self._build_trouble_section), "Troubleshooting")
+        layout.addWidget(extras_tabs)
+    
+    def _build_doc_section(self, layout):
+        """Build the system documentation section"""
         doc_group = QGroupBox("System Documentation")
         doc_layout = QVBoxLayout()
         
@@ -95,27 +291,18 @@ class DriveReplacementModule(TrainingModule):
         
         doc_group.setLayout(doc_layout)
         layout.addWidget(doc_group)
-        
-        # Hardware checklist section
+    
+    def _build_hardware_section(self, layout):
+        """Build the tools and safety checklists"""
         hardware_group = QGroupBox("Hardware Checklist")
         hardware_layout = QVBoxLayout()
         
         tools_layout = QVBoxLayout()
         tools_layout.addWidget(QLabel("Required Tools:"))
         
-        self.tools_checklist = {
-            'torx_t8': QCheckBox("Torx T8 driver"),
-            'torx_t10': QCheckBox("Torx T10 driver"),
-            'torx_t15': QCheckBox("Torx T15 driver"),
-            'torx_t20': QCheckBox("Torx T20 driver"),
-            'anti_static': QCheckBox("Anti-static wrist strap"),
-            'cable_ties': QCheckBox("Cable ties/velcro"),
-            'camera': QCheckBox("Camera for documentation")
-        }
-        
-        for tool, checkbox in self.tools_checklist.items():
-            tools_layout.addWidget(checkbox)
-            checkbox.stateChanged.connect(self.update_checklist)
+        self.tools_checklist = self._build_checklist(self._TOOLS, tools_layout, self.update_checklist)
+        self._tools_checked = 0
+        self._tools_total = len(self.tools_checklist)
         
         hardware_layout.addLayout(tools_layout)
         
@@ -123,23 +310,25 @@ class DriveReplacementModule(TrainingModule):
         safety_layout = QVBoxLayout()
         safety_layout.addWidget(QLabel("Safety Steps:"))
         
-        self.safety_checklist = {
-            'power_off': QCheckBox("Power system off"),
-            'disconnect_ac': QCheckBox("Disconnect AC power"),
-            'discharge': QCheckBox("Press power button 10 seconds"),
-            'wait_30': QCheckBox("Wait 30 seconds"),
-            'grounded': QCheckBox("Properly grounded")
-        }
-        
-        for step, checkbox in self.safety_checklist.items():
-            safety_layout.addWidget(checkbox)
-            checkbox.stateChanged.connect(self.update_safety)
+        self.safety_checklist = self._build_checklist(self._SAFETY, safety_layout, self.update_safety)
+        self._safety_checked = 0
+        self._safety_total = len(self.safety_checklist)
+        self._safety_ready = False
         
         hardware_layout.addLayout(safety_layout)
         hardware_group.setLayout(hardware_layout)
         layout.addWidget(hardware_group)
-        
-        # Drive information section
+    
+    def _build_checklist(self, items, checklist_layout, slot):
+        """Create one checkbox per (key, label) item and return them keyed by item"""
+        boxes = [QCheckBox(label) for _, label in items]
+        for checkbox in boxes:
+            checklist_layout.addWidget(checkbox)
+            checkbox.stateChanged.connect(slot)
+        return dict(zip((key for key, _ in items), boxes))
+    
+    def _build_drive_section(self, layout):
+        """Build the drive information section"""
         drive_group = QGroupBox("Drive Information")
         drive_layout = QVBoxLayout()
         
@@ -175,18 +364,24 @@ class DriveReplacementModule(TrainingModule):
         
         drive_group.setLayout(drive_layout)
         layout.addWidget(drive_group)
-        
-        # Installation process section
+    
+    def _build_install_section(self, layout):
+        """Build the installation process controls"""
         install_group = QGroupBox("Installation Process")
         install_layout = QVBoxLayout()
         
         # Current step display
         self.current_step_label = QLabel("Current Step: Not Started")
-        self.current_step_label.setFont(QFont("Arial", 12, QFont.Bold))
+        self.current_step_label.setFont(self._step_label_font())
         install_layout.addWidget(self.current_step_label)
         
-        # Process buttons
-        process_buttons = [
+        # Step results are logged here rather than in blocking message boxes
+        self.status_panel = QTextEdit()
+        self.status_panel.setReadOnly(True)
+        self.status_panel.setMaximumHeight(150)
+        
+        # Process buttons share one group and are dispatched by step index
+        self._process_steps = (
             ("Start Documentation", self.start_documentation),
             ("Power Down System", self.power_down_system),
             ("Remove Old Drive", self.remove_old_drive),
@@ -194,18 +389,23 @@ class DriveReplacementModule(TrainingModule):
             ("Check BIOS Detection", self.check_bios),
             ("Restore System", self.restore_system),
             ("Test Functionality", self.test_functionality)
-        ]
+        )
+        self._next_step_idx = 0
         
-        for button_text, handler in process_buttons:
+        self.process_group = QButtonGroup(self)
+        for idx, (button_text, _) in enumerate(self._process_steps):
             button = QPushButton(button_text)
-            button.clicked.connect(handler)
+            self.process_group.addButton(button, idx)
             install_layout.addWidget(button)
+        self.process_group.idClicked.connect(self._run_step)
+        
+        install_layout.addWidget(self.status_panel)
         
         install_group.setLayout(install_layout)
         layout.addWidget(install_group)
-        
-        # Performance testing section
-        perf_group = QGroupBox("Performance Testing")
+    
+    def _build_perf_section(self, container):
+        """Build the performance testing section"""
         perf_layout = QVBoxLayout()
         
         benchmark_button = QPushButton("Run Performance Benchmark")
@@ -221,11 +421,10 @@ class DriveReplacementModule(TrainingModule):
         optimization_button.clicked.connect(self.apply_optimizations)
         perf_layout.addWidget(optimization_button)
         
-        perf_group.setLayout(perf_layout)
-        layout.addWidget(perf_group)
-        
-        # Troubleshooting section
-        trouble_group = QGroupBox("Troubleshooting")
+        container.setLayout(perf_layout)
+    
+    def _build_trouble_section(self, container):
+        """Build the troubleshooting section"""
         trouble_layout = QVBoxLayout()
         
         self.issue_combo = QComboBox()
@@ -247,74 +446,91 @@ class DriveReplacementModule(TrainingModule):
         self.troubleshooting_text.setMaximumHeight(100)
         trouble_layout.addWidget(self.troubleshooting_text)
         
-        trouble_group.setLayout(trouble_layout)
-        layout.addWidget(trouble_group)
+        container.setLayout(trouble_layout)
     
     def save_documentation(self):
         """Save current documentation"""
-        self.documentation = {
+        current = {
             'computer_serial': self.computer_serial_input.text(),
             'old_drive': self.old_drive_input.text(),
             'new_drive': self.new_drive_input.text(),
-            'configuration': self.config_text.toPlainText(),
-            'timestamp': datetime.now()
+            'configuration': self.config_text.toPlainText()
         }
         
+        # Nothing to do if the fields have not changed since the last save
+        if self.documentation and all(self.documentation[k] == v for k, v in current.items()):
+            return
+        
+        current['timestamp'] = datetime.now().isoformat(timespec='seconds')
+        self.documentation = current
+        
         # Mark task complete
         self.task_widgets.get("documentation_preparation").set_completed(True)
         self.current_step_label.setText("Current Step: Documentation Complete")
         
-        QMessageBox.information(self, "Documentation Saved",
-                              "System documentation has been saved.")
+        self._append_status("Documentation Saved",
+                            "System documentation has been saved.")
+    
+    def _append_status(self, title, body):
+        """Log a step result to the status panel without blocking"""
+        body_html = escape(body.strip()).replace("\n", "<br>")
+        self.status_panel.append(f"<b>{escape(title)}</b><br>{body_html}")
     
-    def update_checklist(self):
+    def update_checklist(self, state):
         """Update hardware checklist"""
-        all_checked = all(cb.isChecked() for cb in self.tools_checklist.values())
-        if all_checked:
+        self._tools_checked += 1 if Qt.CheckState(state) == Qt.Checked else -1
+        if self._tools_checked == self._tools_total:
             self.hardware_checklist.append("Tools ready")
     
-    def update_safety(self):
+    def update_safety(self, state):
         """Update safety checklist"""
-        all_checked = all(cb.isChecked() for cb in self.safety_checklist.values())
-        if all_checked:
+        self._safety_checked += 1 if Qt.CheckState(state) == Qt.Checked else -1
+        self._safety_ready = self._safety_checked == self._safety_total
+        if self._safety_ready:
             self.task_widgets.get("safe_shutdown").set_completed(True)
             self.current_step_label.setText("Current Step: System Powered Down")
     
+    def _run_step(self, idx):
+        """Run an installation step, refusing to skip ahead of the next pending one"""
+        if idx > self._next_step_idx:
+            pending_text = self._process_steps[self._next_step_idx][0]
+            self._append_status("Step Out of Order",
+                                f"Complete '{pending_text}' before continuing.")
+            return
+        
+        _, handler = self._process_steps[idx]
+        if handler() is False:
+            return
+        
+        if idx == self._next_step_idx:
+            self._next_step_idx += 1
+    
     def start_documentation(self):
         """Start documentation process"""
         self.current_step_label.setText("Current Step: Documenting System")
-        QMessageBox.information(self, "Documentation",
-                              "Please fill in all system information before proceeding.")
+        self._append_status("Documentation",
+                            "Please fill in all system information before proceeding.")
     
     def power_down_system(self):
         """Simulate system power down"""
-        if not all(cb.isChecked() for cb in self.safety_checklist.values()):
+        if not self._safety_ready:
             QMessageBox.warning(self, "Safety Check",
                               "Please complete all safety steps before proceeding.")
-            return
+            return False
         
         self.current_step_label.setText("Current Step: System Safely Powered Down")
-        QMessageBox.information(self, "Power Down",
-                              "System has been safely powered down.\n"
-                              "Ready for hardware replacement.")
+        self._append_status("Power Down",
+                            "System has been safely powered down.\n"
+                            "Ready for hardware replacement.")
     
     def remove_old_drive(self):
         """Simulate drive removal"""
         self.current_step_label.setText("Current Step: Removing Old Drive")
         
-        steps = [
-            "Case opened with appropriate Torx driver",
-            "Drive bay located",
-            "SATA cables disconnected",
-            "Mounting screws removed",
-            "Drive safely removed"
-        ]
-        
-        result = "\n".join([f"✓ {step}" for step in steps])
-        
-        QMessageBox.information(self, "Drive Removal", 
-                              f"Old drive removal complete:\n\n{result}")
+        self._append_status("Drive Removal",
+                            f"Old drive removal complete:\n\n{_REMOVAL_RESULT}")
         
+        self._completed_steps.add("drive_removal")
         self.task_widgets.get("drive_removal").set_completed(True)
     
     def install_new_ssd(self):
@@ -322,149 +538,63 @@ class DriveReplacementModule(TrainingModule):
         self.current_step_label.setText("Current Step: Installing New SSD")
         
         selected_ssd = self.ssd_combo.currentText()
+        result = f"✓ Installed {selected_ssd}\n{_INSTALL_TAIL}"
         
-        steps = [
-            f"Installed {selected_ssd}",
-            "Secured with original Torx screws",
-            "SATA data cable connected (red stripe = pin 1)",
-            "SATA power cable connected",
-            "Cables properly routed and secured"
-        ]
-        
-        result = "\n".join([f"✓ {step}" for step in steps])
-        
-        QMessageBox.information(self, "SSD Installation",
-                              f"SSD installation complete:\n\n{result}")
+        self._append_status("SSD Installation",
+                            f"SSD installation complete:\n\n{result}")
         
+        self._completed_steps.add("ssd_installation")
         self.task_widgets.get("ssd_installation").set_completed(True)
     
     def check_bios(self):
         """Simulate BIOS verification"""
         self.current_step_label.setText("Current Step: Verifying BIOS Detection")
         
-        bios_info = f"""
-BIOS Detection Results:
-✓ New SSD detected: {self.ssd_combo.currentText()}
-✓ SATA mode: AHCI
-✓ Boot order: Correct
-✓ Secure Boot: Disabled
-✓ Fast Boot: Enabled
-        """
+        bios_info = _BIOS_INFO_TEMPLATE.format(ssd=self.ssd_combo.currentText())
         
-        QMessageBox.information(self, "BIOS Verification", bios_info)
+        self._append_status("BIOS Verification", bios_info)
         
+        self._completed_steps.add("bios_verification")
         self.task_widgets.get("bios_verification").set_completed(True)
     
     def restore_system(self):
         """Simulate system restoration"""
         self.current_step_label.setText("Current Step: Restoring System")
         
-        QMessageBox.information(self, "System Restoration",
-                              "System restoration from backup initiated.\n"
-                              "This process typically takes 30-60 minutes.\n\n"
-                              "Status: Restoration complete successfully.")
+        self._append_status("System Restoration",
+                            "System restoration from backup initiated.\n"
+                            "This process typically takes 30-60 minutes.\n\n"
+                            "Status: Restoration complete successfully.")
         
+        self._completed_steps.add("system_restoration")
         self.task_widgets.get("system_restoration").set_completed(True)
     
     def test_functionality(self):
         """Test system functionality"""
         self.current_step_label.setText("Current Step: Testing Functionality")
         
-        test_results = """
-Functionality Test Results:
-✓ Windows booted successfully
-✓ All devices recognized
-✓ Network connectivity verified
-✓ Machine control software operational
-✓ Performance within specifications
-        """
-        
-        QMessageBox.information(self, "Functionality Test", test_results)
+        self._append_status("Functionality Test", _TEST_RESULTS)
         
+        self._completed_steps.add("post_installation_testing")
         self.task_widgets.get("post_installation_testing").set_completed(True)
         self.current_step_label.setText("Current Step: Replacement Complete")
     
     def run_benchmark(self):
         """Simulate performance benchmark"""
-        results = f"""
-Performance Benchmark Results:
-
-Sequential Read: 550 MB/s
-Sequential Write: 520 MB/s
-Random Read (4K): 95,000 IOPS
-Random Write (4K): 88,000 IOPS
-
-Old HDD Performance:
-Sequential Read: 120 MB/s
-Sequential Write: 110 MB/s
-
-Improvement: 458% faster
-        """
-        
-        self.benchmark_results.setText(results)
+        self.benchmark_results.setText(_BENCHMARK_RESULTS)
         self.performance_results = {'benchmark_complete': True}
     
     def apply_optimizations(self):
         """Apply SSD optimizations"""
-        optimizations = """
-SSD Optimizations Applied:
-✓ TRIM enabled
-✓ Superfetch disabled
-✓ Prefetch disabled
-✓ Write caching enabled
-✓ Power management optimized
-✓ Partition alignment verified
-        """
-        
-        self.benchmark_results.append("\n" + optimizations)
-        QMessageBox.information(self, "Optimizations",
-                              "SSD optimizations have been applied successfully.")
+        self.benchmark_results.append("\n" + _OPTIMIZATIONS)
+        self._append_status("Optimizations",
+                            "SSD optimizations have been applied successfully.")
     
     def show_troubleshooting(self):
         """Show troubleshooting steps"""
         issue = self.issue_combo.currentText()
         
-        troubleshooting_guides = {
-            "Drive not detected in BIOS": """
-1. Verify power connection
-2. Check SATA cable orientation
-3. Try different SATA port
-4. Update BIOS firmware
-5. Test with different SATA cable
-            """,
-            "Boot failure after installation": """
-1. Check boot order in BIOS
-2. Verify AHCI mode enabled
-3. Rebuild BCD:
-   bootrec /fixmbr
-   bootrec /fixboot
-   bootrec /rebuildbcd
-4. Check for secure boot conflicts
-            """,
-            "Poor performance": """
-1. Enable AHCI (not IDE mode)
-2. Verify SATA port speed
-3. Align SSD partitions
-4. Update SSD firmware
-5. Check for background processes
-            """,
-            "SMART errors": """
-1. Check drive health utility
-2. Backup data immediately
-3. Run manufacturer diagnostics
-4. Consider warranty replacement
-5. Monitor temperature
-            """,
-            "Connection issues": """
-1. Reseat all connections
-2. Check cable integrity
-3. Try different SATA port
-4. Verify power cable connection
-5. Test with known good cables
-            """
-        }
-        
-        steps = troubleshooting_guides.get(issue, "No troubleshooting guide available.")
+        steps = _TROUBLESHOOTING_GUIDES.get(issue, "No troubleshooting guide available.")
         self.troubleshooting_text.setText(steps)
     
     def validate_task(self, task_id: str) -> bool:
@@ -473,57 +603,16 @@ SSD Optimizations Applied:
             return bool(self.documentation)
         
         elif task_id == "safe_shutdown":
-            return all(cb.isChecked() for cb in self.safety_checklist.values())
-        
-        elif task_id == "drive_removal":
-            return "Removing Old Drive" in self.current_step_label.text()
-        
-        elif task_id == "ssd_installation":
-            return "Installing New SSD" in self.current_step_label.text()
+            return self._safety_ready
         
-        elif task_id == "bios_verification":
-            return "BIOS Detection" in self.current_step_label.text()
-        
-        elif task_id == "system_restoration":
-            return "Restoring System" in self.current_step_label.text()
-        
-        elif task_id == "post_installation_testing":
-            return "Replacement Complete" in self.current_step_label.text()
+        elif task_id in _STEP_TASKS:
+            return task_id in self._completed_steps
         
         return True
     
     def get_additional_resources(self):
         """Get additional resources for this module"""
-        return {
-            "documents": [
-                {
-                    "title": "Drive Replacement Guide",
-                    "path": "resources/drive_replacement_guide.md",
-                    "type": "markdown"
-                }
-            ],
-            "links": [
-                {
-                    "title": "SSD Optimization Guide",
-                    "url": "https://docs.microsoft.com/en-us/windows-hardware/drivers/storage/nvm-express",
-                    "description": "Microsoft NVMe and SSD optimization documentation"
-                }
-            ],
-            "tips": [
-                "Always ground yourself before handling components",
-                "Handle drives by edges only",
-                "Never force connections",
-                "Keep original screws organized",
-                "Document cable routing with photos",
-                "Test drive before final assembly"
-            ],
-            "torx_sizes": {
-                "T8": "Smallest screws",
-                "T10": "Drive mounting screws",
-                "T15": "Case screws",
-                "T20": "Larger case screws"
-            }
-        }
+        return _RESOURCES
 
 # Export the module class
 MODULE_CLASS = DriveReplacementModule
\ No newline at end of file
@@ -4,28 +4,162 @@ IP Address Configuration Training Module
 Interactive module for teaching network IP configuration
 """
 
-import os
-import subprocess
+import errno
 import re
 import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QTextEdit, QLineEdit, QMessageBox, QGroupBox, QCheckBox,
-    QTableWidget, QTableWidgetItem, QHeaderView, QSpinBox,
-    QComboBox, QRadioButton, QButtonGroup
+    QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QTextEdit, QLineEdit, QMessageBox, QGroupBox,
+    QRadioButton, QButtonGroup
 )
-from PySide6.QtCore import Qt, QTimer, Signal
-from PySide6.QtGui import QFont, QColor
+from PySide6.QtCore import QTimer, Signal, QThread, QRegularExpression
+from PySide6.QtGui import QFont, QRegularExpressionValidator, QTextCursor
 from training_module import TrainingModule
 
+try:
+    from icmplib import multiping
+except ImportError:
+    multiping = None
+
+# TCP reachability probe used when ICMP is unavailable; SMB is open on the shop PCs
+_PROBE_PORT = 445
+_PROBE_TIMEOUT = 1.0
+# A refused connection still proves the host answered
+_PROBE_REACHABLE = {0, errno.ECONNREFUSED, getattr(errno, 'WSAECONNREFUSED', errno.ECONNREFUSED)}
+
+# Accepts partially typed addresses so the line edit validator doesn't block input
+_IPV4_PARTIAL_PATTERN = r'^(?:(?:25[0-5]|2[0-4]\d|1?\d?\d)\.){0,3}(?:25[0-5]|2[0-4]\d|1?\d?\d)?$'
+_IPV4_RE = re.compile(r'^((25[0-5]|2[0-4]\d|1?\d?\d)\.){3}(25[0-5]|2[0-4]\d|1?\d?\d)$')
+
+# Seconds a screenshot existence check stays valid
+_SCREENSHOT_CACHE_TTL = 1.0
+
+# Address prefix each network configuration task expects
+_NETWORK_PREFIXES = {
+    "configure_machine_network": "192.168.214.",
+    "configure_riveter_network": "192.168.213.",
+    "configure_video_network": "192.168.1."
+}
+
+# Network information keyed by the network radio button id
+_NETWORK_INFO = {
+    0: """
+<b>Machine Network (192.168.214.x)</b><br>
+Gateway: 192.168.214.1 (NCU)<br>
+Range: 192.168.214.50 - 192.168.214.200<br>
+<br>
+<b>Important Devices:</b><br>
+• Service PC: 192.168.214.34<br>
+• Operator PC: 192.168.214.35<br>
+• Scale PC: 192.168.214.37<br>
+• Riveter PC: 192.168.214.60
+            """,
+    1: """
+<b>Riveter Network (192.168.213.x)</b><br>
+Gateway: 192.168.213.1<br>
+Range: 192.168.213.50 - 192.168.213.250<br>
+<br>
+<b>Important Devices:</b><br>
+• RTX System: 192.168.213.33<br>
+• Riveter PLC: 192.168.213.60
+            """,
+    2: """
+<b>Video Network (192.168.1.x)</b><br>
+Gateway: 192.168.1.1<br>
+Range: 192.168.1.10 - 192.168.1.254<br>
+<br>
+<b>Important Devices:</b><br>
+• Video Gateway: 192.168.1.1
+            """
+}
+
+# (third octet, gateway, primary DNS) keyed by the network radio button id
+_NETWORK_DEFAULTS = {
+    0: (214, "192.168.214.1", "192.168.214.1"),
+    1: (213, "192.168.213.1", "192.168.213.1"),
+    2: (1, "192.168.1.1", "192.168.1.1")
+}
+
+_NETWORK_DIAGRAM = """
+Broetje Automation Network Architecture
+=====================================
+
+[MACHINE NETWORK - 192.168.214.x]
+    |
+    +-- NCU Controller (192.168.214.1) [Gateway]
+    +-- Service PC (192.168.214.34)
+    +-- Operator PC (192.168.214.35)
+    +-- Scale PC/Vision (192.168.214.37)
+    +-- Ketop Tablets (192.168.214.38/39)
+    +-- Riveter PC (192.168.214.60)
+    
+[RIVETER NETWORK - 192.168.213.x]
+    |
+    +-- Gateway (192.168.213.1)
+    +-- RTX System (192.168.213.33)
+    +-- Riveter PLC Backup (192.168.213.60)
+    
+[VIDEO NETWORK - 192.168.1.x]
+    |
+    +-- Video Gateway (192.168.1.1)
+    +-- Recording Devices (192.168.1.x)
+        """
+
+class PingSweepWorker(QThread):
+    """Thread for pinging all test targets concurrently without blocking UI"""
+    results_ready = Signal(int, list)
+    
+    def __init__(self, network_id, targets):
+        super().__init__()
+        self.network_id = network_id
+        self.targets = list(targets)
+        
+    def run(self):
+        results = None
+        if multiping is not None:
+            try:
+                hosts = multiping(self.targets, count=1, timeout=1, privileged=False)
+                results = [self.format_result(host.address, host.is_alive) for host in hosts]
+            except Exception:
+                # Unprivileged ICMP may be unavailable; fall back to TCP probes
+                results = None
+        
+        if results is None:
+            with ThreadPoolExecutor(max_workers=len(self.targets)) as pool:
+                results = list(pool.map(self.probe_target, self.targets))
+        
+        self.results_ready.emit(self.network_id, results)
+    
+    @staticmethod
+    def format_result(target, reachable):
+        """Format a single connectivity result line"""
+        return f"✓ {target} - Reachable" if reachable else f"✗ {target} - Unreachable"
+    
+    @classmethod
+    def probe_target(cls, target):
+        """Check reachability with a TCP connect and return a result line"""
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                sock.settimeout(_PROBE_TIMEOUT)
+                result = sock.connect_ex((target, _PROBE_PORT))
+        except OSError:
+            return f"✗ {target} - Error"
+        return cls.format_result(target, result in _PROBE_REACHABLE)
+
 class IPConfigurationModule(TrainingModule):
     """IP Address Configuration Training Module"""
     
     def __init__(self, module_data, user_data, db_manager=None):
         self.db_manager = db_manager
         self.network_configs = []
+        self._configured_networks = set()
+        self._has_connectivity_test = False
+        self._has_dhcp_applied = False
+        self._screenshot_cache = {}
         super().__init__(module_data, user_data)
         
     def get_learning_objectives(self) -> list:
@@ -65,9 +199,13 @@ class IPConfigurationModule(TrainingModule):
         self.network_button_group.addButton(self.video_network_radio, 2)
         network_layout.addWidget(self.video_network_radio)
         
-        # Network information display
+        # Network information display, refreshed at most once per burst of clicks
+        self._info_timer = QTimer(self)
+        self._info_timer.setSingleShot(True)
+        self._info_timer.setInterval(150)
+        self._info_timer.timeout.connect(self._do_update_network_info)
+        
         self.network_info_label = QLabel()
-        self.update_network_info()
         network_layout.addWidget(self.network_info_label)
         
         self.network_button_group.buttonClicked.connect(self.update_network_info)
@@ -83,31 +221,9 @@ class IPConfigurationModule(TrainingModule):
         ip_layout = QHBoxLayout()
         ip_layout.addWidget(QLabel("IP Address:"))
         
-        self.ip_octet1 = QSpinBox()
-        self.ip_octet1.setRange(0, 255)
-        self.ip_octet1.setValue(192)
-        ip_layout.addWidget(self.ip_octet1)
-        
-        ip_layout.addWidget(QLabel("."))
-        
-        self.ip_octet2 = QSpinBox()
-        self.ip_octet2.setRange(0, 255)
-        self.ip_octet2.setValue(168)
-        ip_layout.addWidget(self.ip_octet2)
-        
-        ip_layout.addWidget(QLabel("."))
-        
-        self.ip_octet3 = QSpinBox()
-        self.ip_octet3.setRange(0, 255)
-        self.ip_octet3.setValue(214)
-        ip_layout.addWidget(self.ip_octet3)
-        
-        ip_layout.addWidget(QLabel("."))
-        
-        self.ip_octet4 = QSpinBox()
-        self.ip_octet4.setRange(0, 255)
-        self.ip_octet4.setValue(100)
-        ip_layout.addWidget(self.ip_octet4)
+        self.ip_input = QLineEdit("192.168.214.100")
+        self.ip_input.setValidator(QRegularExpressionValidator(QRegularExpression(_IPV4_PARTIAL_PATTERN), self))
+        ip_layout.addWidget(self.ip_input)
         
         config_layout.addLayout(ip_layout)
         
@@ -166,9 +282,9 @@ class IPConfigurationModule(TrainingModule):
         apply_button.clicked.connect(self.apply_configuration)
         actions_layout.addWidget(apply_button)
         
-        test_button = QPushButton("Test Configuration")
-        test_button.clicked.connect(self.test_configuration)
-        actions_layout.addWidget(test_button)
+        self.test_button = QPushButton("Test Configuration")
+        self.test_button.clicked.connect(self.test_configuration)
+        actions_layout.addWidget(self.test_button)
         
         open_network_button = QPushButton("Open Network Settings")
         open_network_button.clicked.connect(self.open_network_settings)
@@ -187,6 +303,8 @@ class IPConfigurationModule(TrainingModule):
         
         self.config_log = QTextEdit()
         self.config_log.setReadOnly(True)
+        # Read-only log; an undo stack would only grow with every entry
+        self.config_log.setUndoRedoEnabled(False)
         self.config_log.setMaximumHeight(150)
         log_layout.addWidget(self.config_log)
         
@@ -210,93 +328,70 @@ class IPConfigurationModule(TrainingModule):
         
         diagram_group.setLayout(diagram_layout)
         layout.addWidget(diagram_group)
+        
+        # Populate network defaults once the configuration widgets exist
+        self._do_update_network_info()
+    
+    def _append_log(self, text):
+        """Append plain text to the configuration log in a single insert"""
+        cursor = self.config_log.textCursor()
+        cursor.movePosition(QTextCursor.End)
+        if not self.config_log.document().isEmpty():
+            cursor.insertBlock()
+        cursor.insertText(text)
+        # Keep the newest output in view
+        self.config_log.setTextCursor(cursor)
     
     def update_network_info(self):
+        """Schedule a network information refresh"""
+        self._info_timer.start()
+    
+    def _do_update_network_info(self):
         """Update network information display"""
         network_id = self.network_button_group.checkedId()
+        if network_id not in _NETWORK_INFO:
+            network_id = 2  # Video Network
         
-        if network_id == 0:  # Machine Network
-            info = """
-<b>Machine Network (192.168.214.x)</b><br>
-Gateway: 192.168.214.1 (NCU)<br>
-Range: 192.168.214.50 - 192.168.214.200<br>
-<br>
-<b>Important Devices:</b><br>
-• Service PC: 192.168.214.34<br>
-• Operator PC: 192.168.214.35<br>
-• Scale PC: 192.168.214.37<br>
-• Riveter PC: 192.168.214.60
-            """
-            self.ip_octet3.setValue(214)
-            self.gateway_input.setText("192.168.214.1")
-            self.primary_dns_input.setText("192.168.214.1")
-            
-        elif network_id == 1:  # Riveter Network
-            info = """
-<b>Riveter Network (192.168.213.x)</b><br>
-Gateway: 192.168.213.1<br>
-Range: 192.168.213.50 - 192.168.213.250<br>
-<br>
-<b>Important Devices:</b><br>
-• RTX System: 192.168.213.33<br>
-• Riveter PLC: 192.168.213.60
-            """
-            self.ip_octet3.setValue(213)
-            self.gateway_input.setText("192.168.213.1")
-            self.primary_dns_input.setText("192.168.213.1")
-            
-        else:  # Video Network
-            info = """
-<b>Video Network (192.168.1.x)</b><br>
-Gateway: 192.168.1.1<br>
-Range: 192.168.1.10 - 192.168.1.254<br>
-<br>
-<b>Important Devices:</b><br>
-• Video Gateway: 192.168.1.1
-            """
-            self.ip_octet3.setValue(1)
-            self.gateway_input.setText("192.168.1.1")
-            self.primary_dns_input.setText("192.168.1.1")
+        self.network_info_label.setText(_NETWORK_INFO[network_id])
         
-        self.network_info_label.setText(info)
+        octet3, gateway, dns = _NETWORK_DEFAULTS[network_id]
+        # Move the address onto the selected network, keeping the host part if present
+        octets = self.ip_input.text().split('.')
+        host = octets[3] if len(octets) == 4 and octets[3] else "100"
+        self.ip_input.setText(f"192.168.{octet3}.{host}")
+        self.gateway_input.setText(gateway)
+        self.primary_dns_input.setText(dns)
         
     def update_network_diagram(self):
         """Update the network diagram"""
-        diagram = """
-Broetje Automation Network Architecture
-=====================================
-
-[MACHINE NETWORK - 192.168.214.x]
-    |
-    +-- NCU Controller (192.168.214.1) [Gateway]
-    +-- Service PC (192.168.214.34)
-    +-- Operator PC (192.168.214.35)
-    +-- Scale PC/Vision (192.168.214.37)
-    +-- Ketop Tablets (192.168.214.38/39)
-    +-- Riveter PC (192.168.214.60)
-    
-[RIVETER NETWORK - 192.168.213.x]
-    |
-    +-- Gateway (192.168.213.1)
-    +-- RTX System (192.168.213.33)
-    +-- Riveter PLC Backup (192.168.213.60)
-    
-[VIDEO NETWORK - 192.168.1.x]
-    |
-    +-- Video Gateway (192.168.1.1)
-    +-- Recording Devices (192.168.1.x)
-        """
-        self.network_diagram.setText(diagram)
+        self.network_diagram.setText(_NETWORK_DIAGRAM)
     
     def apply_configuration(self):
         """Apply the IP configuration (simulated)"""
+        # Flush a pending network refresh so the defaults match the selection
+        if self._info_timer.isActive():
+            self._info_timer.stop()
+            self._do_update_network_info()
+        
+        now = datetime.now()
+        
         if self.static_radio.isChecked():
-            ip_address = f"{self.ip_octet1.value()}.{self.ip_octet2.value()}.{self.ip_octet3.value()}.{self.ip_octet4.value()}"
+            ip_address = self.ip_input.text()
+            if not _IPV4_RE.match(ip_address):
+                QMessageBox.warning(self, "Invalid IP Address",
+                                  f"Not a valid IPv4 address: {ip_address}")
+                return
             subnet_mask = self.subnet_mask_input.text()
             gateway = self.gateway_input.text()
             primary_dns = self.primary_dns_input.text()
             secondary_dns = self.secondary_dns_input.text()
             
+            invalid = [dns for dns in (primary_dns, secondary_dns) if dns and not _IPV4_RE.match(dns)]
+            if invalid:
+                QMessageBox.warning(self, "Invalid DNS Server",
+                                  f"Not a valid IPv4 address: {', '.join(invalid)}")
+                return
+            
             config_text = f"""
 Configuration Applied:
 IP Address: {ip_address}
@@ -304,9 +399,9 @@ Subnet Mask: {subnet_mask}
 Gateway: {gateway}
 Primary DNS: {primary_dns}
 Secondary DNS: {secondary_dns}
-Time: {datetime.now().strftime('%H:%M:%S')}
+Time: {now.strftime('%H:%M:%S')}
 """
-            self.config_log.append(config_text)
+            self._append_log(config_text)
             
             # Store configuration
             self.network_configs.append({
@@ -315,8 +410,12 @@ Time: {datetime.now().strftime('%H:%M:%S')}
                 "gateway": gateway,
                 "primary_dns": primary_dns,
                 "secondary_dns": secondary_dns,
-                "time": datetime.now()
+                "time": now
             })
+            self._configured_networks.update(
+                task_id for task_id, prefix in _NETWORK_PREFIXES.items()
+                if ip_address.startswith(prefix)
+            )
             
             # Mark task complete
             if self.network_button_group.checkedId() == 0:
@@ -330,7 +429,8 @@ Time: {datetime.now().strftime('%H:%M:%S')}
                                   f"IP configuration has been applied:\n{ip_address}")
         else:
             config_text = "DHCP Configuration Applied\n"
-            self.config_log.append(config_text)
+            self._append_log(config_text)
+            self._has_dhcp_applied = True
             self.task_widgets.get("restore_dhcp").set_completed(True)
             QMessageBox.information(self, "DHCP Enabled", 
                                   "Network adapter set to obtain IP automatically")
@@ -347,26 +447,19 @@ Time: {datetime.now().strftime('%H:%M:%S')}
         else:  # Video Network
             test_targets = ["192.168.1.1"]
         
-        results = []
-        for target in test_targets:
-            try:
-                response = subprocess.run(
-                    f"ping -n 1 {target}",
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                
-                if "Reply from" in response.stdout:
-                    results.append(f"✓ {target} - Reachable")
-                else:
-                    results.append(f"✗ {target} - Unreachable")
-            except:
-                results.append(f"✗ {target} - Error")
+        # Ping all targets in the background; results arrive in test_complete
+        self.test_button.setEnabled(False)
+        self.ping_worker = PingSweepWorker(network_id, test_targets)
+        self.ping_worker.results_ready.connect(self.test_complete)
+        self.ping_worker.start()
+    
+    def test_complete(self, network_id, results):
+        """Log connectivity test results"""
+        self.test_button.setEnabled(True)
         
         result_text = "\n".join(results)
-        self.config_log.append(f"\nConnectivity Test Results:\n{result_text}\n")
+        self._append_log(f"\nConnectivity Test Results:\n{result_text}\n")
+        self._has_connectivity_test = True
         
         # Mark test task complete
         if network_id == 0:
@@ -376,48 +469,58 @@ Time: {datetime.now().strftime('%H:%M:%S')}
     
     def open_network_settings(self):
         """Open Windows network settings"""
+        import subprocess
         try:
-            os.system('ncpa.cpl')
+            # Launch without waiting; the control panel is a separate window
+            subprocess.Popen(["cmd", "/c", "start", "", "ncpa.cpl"], close_fds=False)
             QMessageBox.information(self, "Network Settings", 
                                   "Network adapter settings window should now be open.")
             self.task_widgets.get("access_network_settings").set_completed(True)
-        except Exception as e:
+        except OSError as e:
             QMessageBox.warning(self, "Error", f"Could not open network settings: {str(e)}")
     
     def show_current_config(self):
         """Show current network configuration"""
+        import subprocess
         try:
             result = subprocess.run("ipconfig /all", shell=True, capture_output=True, text=True)
-            self.config_log.append(f"\nCurrent Configuration:\n{result.stdout}\n")
+            self._append_log(f"\nCurrent Configuration:\n{result.stdout}\n")
         except Exception as e:
-            self.config_log.append(f"Error getting configuration: {str(e)}\n")
+            self._append_log(f"Error getting configuration: {str(e)}\n")
     
     def save_configuration_log(self):
         """Save configuration log to file"""
         from PySide6.QtWidgets import QFileDialog
         
+        now = datetime.now()
         filename, _ = QFileDialog.getSaveFileName(
             self, "Save Configuration Log", 
-            f"network_config_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
+            f"network_config_{now.strftime('%Y%m%d_%H%M%S')}.txt",
             "Text Files (*.txt)"
         )
         
         if filename:
-            with open(filename, 'w') as f:
-                f.write("Broetje Automation Network Configuration Log\n")
-                f.write(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write("="*50 + "\n\n")
-                f.write(self.config_log.toPlainText())
-                
+            parts = [
+                "Broetje Automation Network Configuration Log\n",
+                f"Date: {now.strftime('%Y-%m-%d %H:%M:%S')}\n",
+                "="*50 + "\n\n",
+                self.config_log.toPlainText(),
                 # Add configuration history
-                f.write("\n\nConfiguration History:\n")
-                f.write("-"*30 + "\n")
-                for config in self.network_configs:
-                    f.write(f"Time: {config['time'].strftime('%H:%M:%S')}\n")
-                    f.write(f"IP: {config['ip']}\n")
-                    f.write(f"Gateway: {config['gateway']}\n")
-                    f.write(f"DNS: {config['primary_dns']}, {config['secondary_dns']}\n")
-                    f.write("-"*30 + "\n")
+                "\n\nConfiguration History:\n",
+                "-"*30 + "\n"
+            ]
+            for config in self.network_configs:
+                parts.append(
+                    f"Time: {config['time'].strftime('%H:%M:%S')}\n"
+                    f"IP: {config['ip']}\n"
+                    f"Gateway: {config['gateway']}\n"
+                    f"DNS: {config['primary_dns']}, {config['secondary_dns']}\n"
+                    + "-"*30 + "\n"
+                )
+            
+            # Assemble the whole log and write it in one call
+            with open(filename, 'w', encoding='utf-8', buffering=65536) as f:
+                f.write("".join(parts))
             
             QMessageBox.information(self, "Log Saved", f"Configuration log saved to {filename}")
     
@@ -427,26 +530,33 @@ Time: {datetime.now().strftime('%H:%M:%S')}
             # Check if user has taken screenshot of network settings
             return self.check_screenshot_exists(task_id)
         
-        elif task_id in ["configure_machine_network", "configure_riveter_network", "configure_video_network"]:
-            # Check if appropriate configuration was applied
-            return any(config for config in self.network_configs 
-                      if task_id.replace("configure_", "") in config['ip'])
+        elif task_id in _NETWORK_PREFIXES:
+            # Check if an address on the matching network was applied
+            return task_id in self._configured_networks
         
         elif task_id == "test_machine_network":
             # Check if connectivity test was performed
-            return "Connectivity Test Results" in self.config_log.toPlainText()
+            return self._has_connectivity_test
         
         elif task_id == "restore_dhcp":
             # Check if DHCP was enabled
-            return "DHCP Configuration Applied" in self.config_log.toPlainText()
+            return self._has_dhcp_applied
         
         return True
     
     def check_screenshot_exists(self, task_id: str) -> bool:
         """Check if screenshot for task exists"""
+        # Reuse a recent result so repeated validation doesn't stat every time
+        cached = self._screenshot_cache.get(task_id)
+        now = time.monotonic()
+        if cached and now - cached[0] < _SCREENSHOT_CACHE_TTL:
+            return cached[1]
+        
         screenshot_dir = Path("screenshots") / self.module_data['id']
         screenshot_path = screenshot_dir / f"{task_id}.png"
-        return screenshot_path.exists()
+        exists = screenshot_path.exists()
+        self._screenshot_cache[task_id] = (now, exists)
+        return exists
     
     def get_additional_resources(self):
         """Get additional resources for this module"""
@@ -4,37 +4,66 @@ import os
 import json
 import importlib.util
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+# orjson parses metadata in C when available; the stdlib json module is the fallback
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 class ModuleInfo:
     """Container for module metadata."""
+    __slots__ = (
+        'id', 'name', 'version', 'author', 'description', 'prerequisites',
+        'dependencies', 'difficulty', 'estimated_duration', 'tasks', 'resources',
+        'certification', 'path', 'module_class', '_resolved_resources',
+        '_total_points'
+    )
+    
     def __init__(self, metadata: dict, path: str):
         self.id = metadata.get('id')
         self.name = metadata.get('name')
         self.version = metadata.get('version')
         self.author = metadata.get('author')
         self.description = metadata.get('description')
-        self.prerequisites = metadata.get('prerequisites', [])
+        self.prerequisites = frozenset(metadata.get('prerequisites', []))
         self.dependencies = metadata.get('dependencies', [])
         self.difficulty = metadata.get('difficulty')
         self.estimated_duration = metadata.get('estimated_duration')
         self.tasks = metadata.get('tasks', [])
+        self._total_points = sum(task.get('points', 0) for task in self.tasks)
         self.resources = metadata.get('resources', {})
         self.certification = metadata.get('certification', {})
         self.path = path
         self.module_class = None
+        self._resolved_resources = {}
+        self.resolve_resources()
+        
+    def resolve_resources(self):
+        """Resolve resource paths that exist on disk; call again to refresh."""
+        resolved = {}
+        for resource_type, resource_path in self.resources.items():
+            if not isinstance(resource_path, str):
+                continue
+            full_path = os.path.join(self.path, resource_path)
+            if os.path.exists(full_path):
+                resolved[resource_type] = full_path
+        self._resolved_resources = resolved
         
     def meets_prerequisites(self, completed_modules: List[str]) -> bool:
         """Check if all prerequisites are met."""
-        return all(prereq in completed_modules for prereq in self.prerequisites)
+        return self.prerequisites.issubset(completed_modules)
         
     def get_total_points(self) -> int:
-        """Calculate total points for all tasks."""
-        return sum(task.get('points', 0) for task in self.tasks)
+        """Return total points for all tasks."""
+        return self._total_points
 
 class ModuleLoader:
     """Dynamic module loader for training modules."""
@@ -43,6 +72,8 @@ class ModuleLoader:
         self.modules_directory = Path(modules_directory)
         self.loaded_modules: Dict[str, ModuleInfo] = {}
         self.module_instances: Dict[str, object] = {}
+        # module.py mtimes at last exec, so rescans only re-run changed files
+        self._module_mtimes: Dict[str, float] = {}
         
     def scan_modules(self) -> Dict[str, ModuleInfo]:
         """Scan the modules directory and load all available modules."""
@@ -52,59 +83,104 @@ class ModuleLoader:
             logger.error(f"Modules directory not found: {self.modules_directory}")
             return self.loaded_modules
             
-        for module_dir in self.modules_directory.iterdir():
-            if module_dir.is_dir() and module_dir.name != 'module_loader':
-                metadata_path = module_dir / 'metadata.json'
-                module_py_path = module_dir / 'module.py'
+        # scandir reuses the directory entry type info instead of stat'ing each path
+        candidates = []
+        with os.scandir(self.modules_directory) as entries:
+            for entry in entries:
+                if not entry.is_dir() or entry.name == 'module_loader':
+                    continue
+                    
+                metadata_path = os.path.join(entry.path, 'metadata.json')
+                module_py_path = os.path.join(entry.path, 'module.py')
                 
-                if metadata_path.exists() and module_py_path.exists():
-                    try:
-                        # Load metadata
-                        with open(metadata_path, 'r') as f:
-                            metadata = json.load(f)
-                            
-                        module_info = ModuleInfo(metadata, str(module_dir))
-                        
-                        # Load the module class
-                        module_info.module_class = self._load_module_class(
-                            module_py_path, 
-                            module_info.id
-                        )
-                        
-                        self.loaded_modules[module_info.id] = module_info
-                        logger.info(f"Loaded module: {module_info.name} v{module_info.version}")
-                        
-                    except Exception as e:
-                        logger.error(f"Failed to load module from {module_dir}: {e}")
+                if os.path.isfile(metadata_path) and os.path.isfile(module_py_path):
+                    candidates.append((entry.path, metadata_path, module_py_path))
+        
+        if not candidates:
+            return self.loaded_modules
+        
+        # Metadata files are read in parallel; imports stay serial since they mutate sys.modules
+        with ThreadPoolExecutor(max_workers=min(8, len(candidates))) as executor:
+            metadata_results = list(executor.map(self._read_metadata, candidates))
+        
+        for (module_dir, _, module_py_path), (metadata, error) in zip(candidates, metadata_results):
+            try:
+                if error is not None:
+                    raise error
+                    
+                module_info = ModuleInfo(metadata, module_dir)
+                
+                # Load the module class
+                module_info.module_class = self._load_module_class(
+                    module_py_path, 
+                    module_info.id
+                )
+                
+                self.loaded_modules[module_info.id] = module_info
+                logger.info(f"Loaded module: {module_info.name} v{module_info.version}")
+                
+            except Exception as e:
+                logger.error(f"Failed to load module from {module_dir}: {e}")
                         
         return self.loaded_modules
+    
+    @staticmethod
+    def _read_metadata(candidate):
+        """Read one module's metadata.json, returning (metadata, error)."""
+        _, metadata_path, _ = candidate
+        try:
+            with open(metadata_path, 'rb') as f:
+                return _json_loads(f.read()), None
+        except Exception as e:
+            return None, e
         
-    def _load_module_class(self, module_path: Path, module_id: str):
+    def _load_module_class(self, module_path: str, module_id: str):
         """Dynamically load a module class from a Python file."""
         try:
-            spec = importlib.util.spec_from_file_location(
-                f"modules.{module_id}", 
-                module_path
-            )
+            mod_name = f"modules.{module_id}"
+            mtime = os.stat(module_path).st_mtime
+            module = sys.modules.get(mod_name)
             
-            if spec and spec.loader:
+            # Re-execute module.py only when it is new or has changed on disk
+            if module is None or self._module_mtimes.get(mod_name) != mtime:
+                spec = importlib.util.spec_from_file_location(mod_name, module_path)
+                if not (spec and spec.loader):
+                    return None
+                previous = module
                 module = importlib.util.module_from_spec(spec)
-                sys.modules[spec.name] = module
-                spec.loader.exec_module(module)
-                
-                # Find the module class (should be named after the module)
-                for name, cls in module.__dict__.items():
-                    if (isinstance(cls, type) and 
-                        name.lower().replace('_', '') == module_id.lower().replace('_', '') + 'module'):
-                        return cls
-                        
-                # If no specific class found, look for any TrainingModule subclass
-                for name, cls in module.__dict__.items():
-                    if (isinstance(cls, type) and 
-                        hasattr(cls, '__bases__') and 
-                        'TrainingModule' in [base.__name__ for base in cls.__bases__']):
-                        return cls
-                        
+                sys.modules[mod_name] = module
+                try:
+                    spec.loader.exec_module(module)
+                except Exception:
+                    if previous is None:
+                        del sys.modules[mod_name]
+                        raise
+                    # Keep the last working version; the mtime is left stale so
+                    # the next scan tries the edited file again
+                    sys.modules[mod_name] = module = previous
+                    logger.exception(f"Reloading {module_path} failed; keeping the loaded version")
+                else:
+                    self._module_mtimes[mod_name] = mtime
+            
+            # Modules export their class explicitly as MODULE_CLASS
+            cls = getattr(module, 'MODULE_CLASS', None)
+            if isinstance(cls, type):
+                return cls
+            
+            # Legacy modules: find the class named after the module
+            expected_name = module_id.lower().replace('_', '') + 'module'
+            for name, cls in module.__dict__.items():
+                if (isinstance(cls, type) and 
+                    name.lower().replace('_', '') == expected_name):
+                    return cls
+                    
+            # If no specific class found, look for any TrainingModule subclass
+            for name, cls in module.__dict__.items():
+                if (isinstance(cls, type) and 
+                    hasattr(cls, '__bases__') and 
+                    'TrainingModule' in [base.__name__ for base in cls.__bases__]):
+                    return cls
+                    
         except Exception as e:
             logger.error(f"Failed to load module class from {module_path}: {e}")
             
@@ -137,15 +213,11 @@ class ModuleLoader:
         
     def get_available_modules(self, completed_modules: List[str] = None) -> List[ModuleInfo]:
         """Get list of modules that can be started based on prerequisites."""
-        if completed_modules is None:
-            completed_modules = []
-            
-        available = []
-        for module_info in self.loaded_modules.values():
-            if module_info.meets_prerequisites(completed_modules):
-                available.append(module_info)
-                
-        return available
+        completed_set = frozenset(completed_modules or ())
+        return [
+            module_info for module_info in self.loaded_modules.values()
+            if module_info.prerequisites <= completed_set
+        ]
         
     def check_dependencies(self, module_id: str) -> bool:
         """Check if all dependencies for a module are satisfied."""
@@ -163,15 +235,7 @@ class ModuleLoader:
         if not module_info:
             return {}
             
-        resources = {}
-        module_path = Path(module_info.path)
-        
-        for resource_type, resource_path in module_info.resources.items():
-            full_path = module_path / resource_path
-            if full_path.exists():
-                resources[resource_type] = str(full_path)
-                
-        return resources
+        return dict(module_info._resolved_resources)
 
 # Singleton instance
 _module_loader_instance = None
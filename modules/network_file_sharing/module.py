@@ -5,22 +5,65 @@ Interactive module for teaching network drive mapping and file sharing
 """
 
 import os
+import ctypes
 import subprocess
 from pathlib import Path
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QTextEdit, QLineEdit, QMessageBox, QGroupBox, QCheckBox,
-    QFileDialog, QComboBox
+    QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QLineEdit, QMessageBox, QGroupBox, QComboBox
 )
-from PySide6.QtCore import Qt, QTimer, Signal
-from PySide6.QtGui import QFont, QPixmap
-from training_module import TrainingModule
+from PySide6.QtCore import QTimer, QProcess, QFileSystemWatcher
+from training_module import TrainingModule, LazySection
+
+# Drive letter bitmask as returned by GetLogicalDrives (bit 0 is A:). C: through Z:;
+# A: and B: are reserved for floppy drives and never offered for mapping
+_MAPPABLE_DRIVES_MASK = 0x03FFFFFC
+# Assumed in use when the real drive list is unavailable
+_FALLBACK_USED_MASK = (1 << 2) | (1 << 3)  # C: and D:
+
+# Keep console tools from flashing a window; the flag only exists on Windows
+_NO_WINDOW = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+
+_NETWORK_PATH_QSS = "font-weight: bold; color: #2c3e50; font-size: 14px;"
+
+class _LazyComboBox(QComboBox):
+    """Combo box whose items are fetched the first time they are needed"""
+    
+    def __init__(self, fetch_items):
+        super().__init__()
+        self._fetch_items = fetch_items
+        
+    def ensure_items(self):
+        if self._fetch_items is not None:
+            fetch, self._fetch_items = self._fetch_items, None
+            self.addItems(fetch())
+            # A placeholder keeps the index at -1; select the first letter as before
+            if self.currentIndex() < 0 and self.count():
+                self.setCurrentIndex(0)
+        
+    def showPopup(self):
+        self.ensure_items()
+        super().showPopup()
+        
+    def focusInEvent(self, event):
+        self.ensure_items()
+        super().focusInEvent(event)
+        
+    def wheelEvent(self, event):
+        self.ensure_items()
+        super().wheelEvent(event)
 
 class NetworkFileSharingModule(TrainingModule):
     """Network File Sharing & Mapping Training Module"""
     
     def __init__(self, module_data, user_data, db_manager=None):
         self.db_manager = db_manager
+        # Logical drives rarely change mid-session; rebuilt after a drive is mapped
+        self._drive_letter_cache = None
+        self._last_network_path = None
+        # Screenshot file names, dropped whenever the watched directory changes
+        self._screenshot_cache = None
+        self._screenshot_watcher = None
         super().__init__(module_data, user_data)
         
     def get_learning_objectives(self) -> list:
@@ -46,40 +89,39 @@ class NetworkFileSharingModule(TrainingModule):
         
         # Get the content widget from the scroll area
         overview_widget = scroll_area.widget()
-        layout = overview_widget.layout()
+        
+        # Overview is the default tab, so this only defers building until the
+        # window is first shown; drive enumeration waits for the combo itself
+        overview_widget.layout().addWidget(LazySection(self._build_overview_sections))
+    
+    def _build_overview_sections(self, container):
+        """Build the network, drive mapping and quick action sections"""
+        layout = QVBoxLayout(container)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(15)
         
         # Add module-specific content
         network_group = QGroupBox("Network Configuration Helper")
         network_layout = QVBoxLayout()
         network_layout.setSpacing(10)  # Add spacing
         
-        # Computer name input
-        computer_layout = QHBoxLayout()
-        computer_layout.addWidget(QLabel("Computer Name:"))
-        self.computer_name_input = QLineEdit()
-        self.computer_name_input.setPlaceholderText("e.g., PC-001")
-        self.computer_name_input.setMinimumHeight(30)  # Ensure minimum height
-        computer_layout.addWidget(self.computer_name_input)
-        network_layout.addLayout(computer_layout)
-        
-        # Share name input
-        share_layout = QHBoxLayout()
-        share_layout.addWidget(QLabel("Share Name:"))
-        self.share_name_input = QLineEdit()
-        self.share_name_input.setPlaceholderText("e.g., SharedFolder")
-        self.share_name_input.setMinimumHeight(30)  # Ensure minimum height
-        share_layout.addWidget(self.share_name_input)
-        network_layout.addLayout(share_layout)
+        # Computer and share name inputs
+        self.computer_name_input = self._add_labeled_input(network_layout, "Computer Name:", "e.g., PC-001")
+        self.share_name_input = self._add_labeled_input(network_layout, "Share Name:", "e.g., SharedFolder")
         
         # Network path display
         self.network_path_label = QLabel("Network Path: ")
-        self.network_path_label.setStyleSheet("font-weight: bold; color: #2c3e50; font-size: 14px;")
+        self.network_path_label.setStyleSheet(_NETWORK_PATH_QSS)
         self.network_path_label.setMinimumHeight(30)
         network_layout.addWidget(self.network_path_label)
         
-        # Update network path when inputs change
-        self.computer_name_input.textChanged.connect(self.update_network_path)
-        self.share_name_input.textChanged.connect(self.update_network_path)
+        # Coalesce bursts of keystrokes into one network path update
+        self._path_timer = QTimer(self)
+        self._path_timer.setSingleShot(True)
+        self._path_timer.setInterval(50)
+        self._path_timer.timeout.connect(self.update_network_path)
+        self.computer_name_input.textChanged.connect(self.schedule_network_path_update)
+        self.share_name_input.textChanged.connect(self.schedule_network_path_update)
         
         network_group.setLayout(network_layout)
         layout.addWidget(network_group)
@@ -91,9 +133,8 @@ class NetworkFileSharingModule(TrainingModule):
         # Drive letter selection
         drive_letter_layout = QHBoxLayout()
         drive_letter_layout.addWidget(QLabel("Drive Letter:"))
-        self.drive_letter_combo = QComboBox()
-        available_drives = self.get_available_drive_letters()
-        self.drive_letter_combo.addItems(available_drives)
+        self.drive_letter_combo = _LazyComboBox(self.get_available_drive_letters)
+        self.drive_letter_combo.setPlaceholderText("Select...")
         drive_letter_layout.addWidget(self.drive_letter_combo)
         drive_layout.addLayout(drive_letter_layout)
         
@@ -110,59 +151,97 @@ class NetworkFileSharingModule(TrainingModule):
         actions_layout = QVBoxLayout()
         actions_layout.setSpacing(8)  # Add proper spacing
         
-        open_sharing_button = QPushButton("Open Network Sharing Center")
-        open_sharing_button.setMinimumHeight(35)
-        open_sharing_button.clicked.connect(self.open_sharing_center)
-        actions_layout.addWidget(open_sharing_button)
-        
-        open_disk_mgmt_button = QPushButton("Open Disk Management")
-        open_disk_mgmt_button.setMinimumHeight(35)
-        open_disk_mgmt_button.clicked.connect(self.open_disk_management)
-        actions_layout.addWidget(open_disk_mgmt_button)
-        
-        test_connection_button = QPushButton("Test Network Connection")
-        test_connection_button.setMinimumHeight(35)
-        test_connection_button.clicked.connect(self.test_network_connection)
-        actions_layout.addWidget(test_connection_button)
+        actions = (
+            ("Open Network Sharing Center", self.open_sharing_center),
+            ("Open Disk Management", self.open_disk_management),
+            ("Test Network Connection", self.test_network_connection),
+            ("Detailed Connection Test", self.detailed_network_test),
+        )
+        buttons = []
+        for label, slot in actions:
+            button = QPushButton(label)
+            button.setMinimumHeight(35)
+            button.clicked.connect(slot)
+            actions_layout.addWidget(button)
+            buttons.append(button)
+        # The connection tests disable these while a ping is running
+        self.test_connection_button, self.detailed_test_button = buttons[2:]
         
         actions_group.setLayout(actions_layout)
         layout.addWidget(actions_group)
         
+    @staticmethod
+    def _add_labeled_input(layout, label, placeholder):
+        """Add a labelled QLineEdit row to layout and return the line edit"""
+        row = QHBoxLayout()
+        row.addWidget(QLabel(label))
+        line_edit = QLineEdit()
+        line_edit.setPlaceholderText(placeholder)
+        line_edit.setMinimumHeight(30)  # Ensure minimum height
+        row.addWidget(line_edit)
+        layout.addLayout(row)
+        return line_edit
+    
+    def schedule_network_path_update(self):
+        """Schedule a network path refresh"""
+        self._path_timer.start()
+    
     def update_network_path(self):
         """Update the network path display"""
         computer_name = self.computer_name_input.text().strip()
         share_name = self.share_name_input.text().strip()
         
-        if computer_name and share_name:
-            network_path = f"\\\\{computer_name}\\{share_name}"
-            self.network_path_label.setText(f"Network Path: {network_path}")
-        else:
-            self.network_path_label.setText("Network Path: ")
+        network_path = f"\\\\{computer_name}\\{share_name}" if computer_name and share_name else ""
+        if network_path == self._last_network_path:
+            return
+        
+        self._last_network_path = network_path
+        self.network_path_label.setText(f"Network Path: {network_path}")
     
     def get_available_drive_letters(self):
         """Get list of available drive letters"""
-        import string
-        used_drives = []
+        if self._drive_letter_cache is not None:
+            return self._drive_letter_cache
         
-        try:
-            # Windows only - get used drive letters
-            if os.name == 'nt':
-                import win32api
-                drives = win32api.GetLogicalDriveStrings()
-                drives = drives.split('\000')[:-1]
-                used_drives = [d[0].upper() for d in drives]
-        except:
-            # Fallback if win32api not available
-            used_drives = ['C', 'D']
-        
-        # Return available letters
-        all_letters = list(string.ascii_uppercase)
-        available = [f"{letter}:" for letter in all_letters 
-                    if letter not in used_drives and letter not in ['A', 'B']]
+        used_mask = 0
+        
+        # Windows only - get used drive letters
+        if os.name == 'nt':
+            used_mask = ctypes.windll.kernel32.GetLogicalDrives() or _FALLBACK_USED_MASK
+        
+        # Walk the free bits lowest first, i.e. in alphabetical order
+        available = []
+        bits = ~used_mask & _MAPPABLE_DRIVES_MASK
+        while bits:
+            lowest = bits & -bits
+            available.append(f"{chr(ord('A') + lowest.bit_length() - 1)}:")
+            bits ^= lowest
+        
+        self._drive_letter_cache = available
         return available
     
+    def _run_async(self, program, args, callback):
+        """Run a program via QProcess and pass (exit_code, stdout, stderr) bytes to callback"""
+        process = QProcess(self)
+        
+        def finished(exit_code, exit_status):
+            callback(exit_code,
+                     process.readAllStandardOutput().data(),
+                     process.readAllStandardError().data())
+            process.deleteLater()
+        
+        def failed(error):
+            if error == QProcess.FailedToStart:
+                callback(-1, b"", process.errorString().encode())
+                process.deleteLater()
+        
+        process.finished.connect(finished)
+        process.errorOccurred.connect(failed)
+        process.start(program, args)
+    
     def map_network_drive(self):
         """Map a network drive using Windows net use command"""
+        self.drive_letter_combo.ensure_items()
         drive_letter = self.drive_letter_combo.currentText()
         computer_name = self.computer_name_input.text().strip()
         share_name = self.share_name_input.text().strip()
@@ -174,46 +253,66 @@ class NetworkFileSharingModule(TrainingModule):
         
         network_path = f"\\\\{computer_name}\\{share_name}"
         
-        try:
-            # Windows net use command
-            cmd = f'net use {drive_letter} "{network_path}" /persistent:yes'
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                QMessageBox.information(self, "Success", 
-                                      f"Successfully mapped {network_path} to {drive_letter}")
-                # Mark task as complete
-                for task_id, widget in self.task_widgets.items():
-                    if "map_network_drive" in task_id:
-                        widget.set_completed(True)
-            else:
-                QMessageBox.warning(self, "Mapping Failed", 
-                                  f"Failed to map drive: {result.stderr}")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Error mapping drive: {str(e)}")
+        # net use can wait on the remote host; keep the UI responsive meanwhile
+        self.map_drive_button.setEnabled(False)
+        self._run_async(
+            "net", ["use", drive_letter, network_path, "/persistent:yes"],
+            lambda code, out, err: self._on_map_done(code, err, drive_letter, network_path)
+        )
+    
+    def _on_map_done(self, exit_code, stderr, drive_letter, network_path):
+        """Report the result of a net use mapping"""
+        self.map_drive_button.setEnabled(True)
+        
+        if exit_code == 0:
+            QMessageBox.information(self, "Success", 
+                                  f"Successfully mapped {network_path} to {drive_letter}")
+            # The mapped letter is no longer free
+            self._drive_letter_cache = None
+            self.drive_letter_combo.clear()
+            self.drive_letter_combo.addItems(self.get_available_drive_letters())
+            # Mark task as complete
+            widget = self.task_widgets.get("map_network_drive")
+            if widget:
+                widget.set_completed(True)
+        else:
+            QMessageBox.warning(self, "Mapping Failed", 
+                              f"Failed to map drive: {stderr.decode(errors='replace')}")
     
     def open_sharing_center(self):
         """Open Windows Network and Sharing Center"""
-        try:
-            if os.name == 'nt':
-                os.system('control.exe /name Microsoft.NetworkAndSharingCenter')
-            QMessageBox.information(self, "Opening", 
-                                  "Network and Sharing Center should now be open.")
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Could not open sharing center: {str(e)}")
+        # Launch without waiting; os.startfile only takes arguments on 3.10+
+        self._open_system_tool(
+            lambda: subprocess.Popen(["control.exe", "/name", "Microsoft.NetworkAndSharingCenter"]),
+            "Network and Sharing Center", "sharing center"
+        )
     
     def open_disk_management(self):
         """Open Windows Disk Management"""
+        # Hand the snap-in to the shell and return immediately
+        self._open_system_tool(lambda: os.startfile('diskmgmt.msc'),
+                               "Disk Management", "disk management")
+    
+    def _open_system_tool(self, launch, name, short_name):
+        """Run launch() on Windows and report whether the tool opened"""
         try:
             if os.name == 'nt':
-                os.system('diskmgmt.msc')
-            QMessageBox.information(self, "Opening", 
-                                  "Disk Management should now be open.")
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Could not open disk management: {str(e)}")
+                launch()
+            QMessageBox.information(self, "Opening", f"{name} should now be open.")
+        except OSError as e:
+            QMessageBox.warning(self, "Error", f"Could not open {short_name}: {str(e)}")
     
     def test_network_connection(self):
         """Test network connection to specified computer"""
+        # One probe is enough to answer reachable/unreachable
+        self._start_ping(["-n", "1", "-w", "1000"], detailed=False)
+    
+    def detailed_network_test(self):
+        """Run a full four-probe ping and show its output"""
+        self._start_ping(["-n", "4"], detailed=True)
+    
+    def _start_ping(self, options, detailed):
+        """Ping the entered computer in the background"""
         computer_name = self.computer_name_input.text().strip()
         
         if not computer_name:
@@ -221,19 +320,29 @@ class NetworkFileSharingModule(TrainingModule):
                               "Please enter a computer name to test.")
             return
         
-        try:
-            # Ping test
-            cmd = f"ping -n 4 {computer_name}"
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            
-            if "Reply from" in result.stdout:
-                QMessageBox.information(self, "Connection Test", 
-                                      f"Successfully connected to {computer_name}")
-            else:
-                QMessageBox.warning(self, "Connection Test", 
-                                  f"Could not reach {computer_name}\n\n{result.stdout}")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Error testing connection: {str(e)}")
+        # The result arrives in _on_ping_done
+        self.test_connection_button.setEnabled(False)
+        self.detailed_test_button.setEnabled(False)
+        self._run_async(
+            "ping", options + [computer_name],
+            lambda code, out, err: self._on_ping_done(code, out, err, computer_name, detailed)
+        )
+    
+    def _on_ping_done(self, exit_code, stdout, stderr, computer_name, detailed):
+        """Report the result of a connection test"""
+        self.test_connection_button.setEnabled(True)
+        self.detailed_test_button.setEnabled(True)
+        
+        # ping exits 0 when a reply came back, regardless of display language
+        if exit_code == 0:
+            message = f"Successfully connected to {computer_name}"
+            if detailed:
+                message += f"\n\n{stdout.decode(errors='replace')}"
+            QMessageBox.information(self, "Connection Test", message)
+        else:
+            output = (stdout or stderr).decode(errors='replace')
+            QMessageBox.warning(self, "Connection Test", 
+                              f"Could not reach {computer_name}\n\n{output}")
     
     def validate_task(self, task_id: str) -> bool:
         """Validate specific task completion"""
@@ -243,19 +352,21 @@ class NetworkFileSharingModule(TrainingModule):
         
         elif task_id == "create_temp_directory":
             # Check if D:\Temp directory exists
-            temp_path = Path("D:/Temp")
-            if temp_path.exists() and temp_path.is_dir():
-                # Check for user initials subdirectory
-                user_dirs = list(temp_path.iterdir())
-                return len(user_dirs) > 0
-            return False
+            try:
+                # Check for user initials subdirectory; stop at the first entry
+                with os.scandir("D:/Temp") as entries:
+                    return next(entries, None) is not None
+            except OSError:
+                return False
         
         elif task_id == "map_network_drive":
             # Check if any network drives are mapped
             try:
-                result = subprocess.run("net use", shell=True, capture_output=True, text=True)
-                return "OK" in result.stdout
-            except:
+                # Only an ASCII status word is checked, so skip decoding the output
+                result = subprocess.run(["net", "use"], capture_output=True,
+                                        creationflags=_NO_WINDOW)
+                return b"OK" in result.stdout
+            except (subprocess.SubprocessError, OSError):
                 return False
         
         elif task_id == "test_file_transfer":
@@ -266,9 +377,30 @@ class NetworkFileSharingModule(TrainingModule):
     
     def check_screenshot_exists(self, task_id: str) -> bool:
         """Check if screenshot for task exists"""
-        screenshot_dir = Path("screenshots") / self.module_data['id']
-        screenshot_path = screenshot_dir / f"{task_id}.png"
-        return screenshot_path.exists()
+        if self._screenshot_cache is None:
+            self._refresh_screenshot_cache()
+        return self._screenshot_cache is not None and f"{task_id}.png" in self._screenshot_cache
+    
+    def _refresh_screenshot_cache(self):
+        """List the screenshot directory once and watch it for changes"""
+        screenshot_dir = str(Path("screenshots") / self.module_data['id'])
+        try:
+            with os.scandir(screenshot_dir) as entries:
+                names = frozenset(entry.name for entry in entries)
+        except OSError:
+            # Nothing to watch yet; look again on the next check
+            return
+        
+        if self._screenshot_watcher is None:
+            self._screenshot_watcher = QFileSystemWatcher(self)
+            self._screenshot_watcher.directoryChanged.connect(self._invalidate_screenshot_cache)
+        if screenshot_dir not in self._screenshot_watcher.directories():
+            self._screenshot_watcher.addPath(screenshot_dir)
+        self._screenshot_cache = names
+    
+    def _invalidate_screenshot_cache(self, path):
+        """Forget cached screenshot names after the directory changes"""
+        self._screenshot_cache = None
 
 # Must be at module level
 MODULE_CLASS = NetworkFileSharingModule
\ No newline at end of file
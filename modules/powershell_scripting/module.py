@@ -5,28 +5,326 @@ Interactive module for teaching advanced PowerShell scripting
 """
 
 import os
+import re
+import json
+import random
+import base64
+import shutil
 import subprocess
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from pathlib import Path
+from pathlib import Path, PureWindowsPath
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QTextEdit, QLineEdit, QMessageBox, QGroupBox, QCheckBox,
     QTableWidget, QTableWidgetItem, QHeaderView, QComboBox,
     QRadioButton, QButtonGroup, QSpinBox, QListWidget,
-    QListWidgetItem, QFileDialog
+    QListWidgetItem, QFileDialog, QTabWidget, QProgressDialog
 )
-from PySide6.QtCore import Qt, QTimer, Signal
+from PySide6.QtCore import Qt, QTimer, Signal, QProcess
 from PySide6.QtGui import QFont, QTextCharFormat, QTextCursor, QColor
 from training_module import TrainingModule
 
+# Private generator for the simulated device tests
+_rand = random.Random()
+
+_IPV4_RE = re.compile(r'\b(?:\d{1,3}\.){3}\d{1,3}\b')
+
+# One long-lived PowerShell reads commands from stdin; the console simulation is
+# used when no PowerShell is installed
+_PS_EXECUTABLE = shutil.which("pwsh") or shutil.which("powershell")
+# Flags for every PowerShell this module starts: no profile or banner slowing
+# startup, and no prompts or execution policy blocking unattended runs
+_PS_FLAGS = ("-NoProfile", "-NoLogo", "-NonInteractive", "-ExecutionPolicy", "Bypass")
+# Printed after each command, with a per-command token, so its output can be
+# told apart from the next one
+_PS_END_MARKER = "___END_{token}___"
+_PS_SETUP = "[Console]::OutputEncoding = [Text.Encoding]::UTF8\n"
+
+# Pings every device concurrently in the shared session and prints the replies
+# as JSON, so a scan takes as long as the slowest device rather than the sum
+_PS_DEVICE_TEST = """
+$ips = @({ips})
+$pings = @(foreach ($ip in $ips) {{ (New-Object System.Net.NetworkInformation.Ping).SendPingAsync($ip, 1000) }})
+try {{ [Threading.Tasks.Task]::WaitAll($pings) }} catch {{ }}
+@(for ($i = 0; $i -lt $ips.Count; $i++) {{
+    $ping = $pings[$i]
+    if ($ping.Status -eq 'RanToCompletion' -and $ping.Result.Status -eq 'Success') {{
+        [pscustomobject]@{{ Ip = $ips[$i]; Ms = $ping.Result.RoundtripTime }}
+    }}
+}}) | ConvertTo-Json -Compress
+"""
+
+_TEMPLATE_BASIC = """# OpenHelloWorld.ps1
+# Clear screen
+Clear-Host
+
+# Display message
+Write-Host "Opening Hello World file..." -ForegroundColor Green
+
+# Define file path
+$filePath = "D:\\Temp\\$env:USERNAME\\PowerShellScripts\\Hello_World.txt"
+
+# Check if file exists
+if (Test-Path $filePath) {
+    # Open file in Notepad
+    Start-Process notepad.exe -ArgumentList $filePath
+    Write-Host "File opened successfully!" -ForegroundColor Green
+} else {
+    Write-Host "File not found: $filePath" -ForegroundColor Red
+}
+
+# Pause for user input
+Read-Host "Press Enter to exit"
+"""
+
+_TEMPLATE_NETWORK = """# Broetje-NetworkDiagnostics.ps1
+param(
+    [string]$OutputPath = "D:\\Temp\\$env:USERNAME\\NetworkDiagnostics.txt"
+)
+
+# Define Broetje network devices
+$broetjeDevices = @{
+    "NCU Controller" = "192.168.214.1"
+    "Service PC" = "192.168.214.34"
+    "Operator PC" = "192.168.214.35"
+    "Scale PC (Vision)" = "192.168.214.37"
+    "Riveter PC" = "192.168.214.60"
+    "RTX System" = "192.168.213.33"
+}
+
+# Initialize report
+$report = @()
+$report += "=================================="
+$report += "Broetje Network Diagnostic Report"
+$report += "Date: $(Get-Date)"
+$report += "=================================="
+
+# Test each device
+foreach ($device in $broetjeDevices.GetEnumerator()) {
+    Write-Host "Testing $($device.Key)..." -ForegroundColor Yellow
+    
+    try {
+        $ping = Test-Connection -ComputerName $device.Value -Count 1 -ErrorAction Stop
+        $status = "ONLINE"
+        $responseTime = "$($ping.ResponseTime)ms"
+        $color = "Green"
+    }
+    catch {
+        $status = "OFFLINE"
+        $responseTime = "N/A"
+        $color = "Red"
+    }
+    
+    $line = "$($device.Key.PadRight(20)) $($device.Value.PadRight(15)) $status $responseTime"
+    $report += $line
+    Write-Host $line -ForegroundColor $color
+}
+
+# Save report
+$report | Out-File -FilePath $OutputPath -Encoding utf8
+Write-Host "`nReport saved to: $OutputPath" -ForegroundColor Cyan
+
+# Open report
+Start-Process notepad.exe -ArgumentList $OutputPath
+"""
+
+_TEMPLATE_BACKUP = """# Broetje-BackupManager.ps1
+function New-BroetjeBackup {
+    param(
+        [Parameter(Mandatory)]
+        [string]$MachineNumber,
+        
+        [Parameter(Mandatory)]
+        [string]$MachineInitials,
+        
+        [Parameter(Mandatory)]
+        [ValidateSet('NC','DD','HMI','PLC','S7')]
+        [string]$BackupType,
+        
+        [string]$SourcePath = "C:\\Data",
+        [string]$DestinationPath = "\\\\server\\backups"
+    )
+    
+    # Generate backup filename
+    $date = Get-Date -Format "yyyyMMdd"
+    $backupName = "${MachineNumber}_${MachineInitials}_${BackupType}_${date}"
+    
+    # Create destination directory
+    $destDir = Join-Path $DestinationPath $MachineNumber
+    if (!(Test-Path $destDir)) {
+        New-Item -Path $destDir -ItemType Directory -Force
+    }
+    
+    # Define backup destination
+    $destFile = Join-Path $destDir "${backupName}.zip"
+    
+    Write-Host "Creating backup: $backupName" -ForegroundColor Green
+    
+    try {
+        # Compress source to destination
+        Compress-Archive -Path $SourcePath -DestinationPath $destFile -Force
+        
+        Write-Host "Backup completed: $destFile" -ForegroundColor Green
+        return $destFile
+    }
+    catch {
+        Write-Host "Backup failed: $_" -ForegroundColor Red
+        return $null
+    }
+}
+
+# Example usage
+New-BroetjeBackup -MachineNumber "AP1741" -MachineInitials "R1" -BackupType "NC"
+"""
+
+_TEMPLATE_FILE_TRANSFER = """# Broetje-FileTransfer.ps1
+function Copy-ToMachine {
+    param(
+        [Parameter(Mandatory)]
+        [string]$SourceFile,
+        
+        [Parameter(Mandatory)]
+        [string]$TargetIP,
+        
+        [string]$RemotePath = "C:\\Temp",
+        [PSCredential]$Credential
+    )
+    
+    Write-Host "Transferring file to $TargetIP..." -ForegroundColor Cyan
+    
+    try {
+        # Test network connectivity
+        if (!(Test-Connection -ComputerName $TargetIP -Count 1 -Quiet)) {
+            throw "Cannot reach target machine: $TargetIP"
+        }
+        
+        # Build UNC path
+        $uncPath = "\\\\$TargetIP\\$(($RemotePath).Replace(':', '$'))"
+        
+        # Copy file
+        Copy-Item -Path $SourceFile -Destination $uncPath -Force
+        
+        Write-Host "File transferred successfully!" -ForegroundColor Green
+    }
+    catch {
+        Write-Host "Transfer failed: $_" -ForegroundColor Red
+    }
+}
+
+# Example usage
+Copy-ToMachine -SourceFile "D:\\Temp\\test.txt" -TargetIP "192.168.214.35"
+"""
+
+_TEMPLATE_STARTUP = """# Startup-BroetjeTasks.ps1
+# This runs when user logs in
+
+# Set up logging
+$logFile = "D:\\Temp\\$env:USERNAME\\startup_log.txt"
+Add-Content $logFile "$(Get-Date): Startup script initiated"
+
+# Wait for network
+Start-Sleep -Seconds 5
+
+# Test critical connections
+$criticalIPs = @("192.168.214.1", "192.168.214.34", "192.168.214.60")
+foreach ($ip in $criticalIPs) {
+    if (Test-Connection -ComputerName $ip -Count 1 -Quiet) {
+        Add-Content $logFile "$(Get-Date): $ip - ONLINE"
+    } else {
+        Add-Content $logFile "$(Get-Date): $ip - OFFLINE"
+    }
+}
+
+# Open Hello World file
+$helloFile = "D:\\Temp\\$env:USERNAME\\PowerShellScripts\\Hello_World.txt"
+if (Test-Path $helloFile) {
+    Start-Process notepad.exe -ArgumentList $helloFile
+    Add-Content $logFile "$(Get-Date): Opened Hello World file"
+}
+
+Add-Content $logFile "$(Get-Date): Startup script completed"
+"""
+
+# Simulated Get-Help output, filled in with the cmdlet asked about
+_HELP_TEMPLATE = """
+NAME
+    {cmdlet}
+
+SYNOPSIS
+    Gets help information for PowerShell cmdlets
+
+SYNTAX
+    {cmdlet} [[-Name] <String>] [-Full] [-Examples]
+
+DESCRIPTION
+    The {cmdlet} cmdlet displays information about PowerShell concepts and commands.
+
+EXAMPLES
+    {cmdlet} Get-Process
+    {cmdlet} Get-Process -Full
+            """
+
+# Script Templates combo entries, in display order
+_TEMPLATES = {
+    "Basic Hello World Script": _TEMPLATE_BASIC,
+    "Network Diagnostic Script": _TEMPLATE_NETWORK,
+    "Backup Management Script": _TEMPLATE_BACKUP,
+    "File Transfer Script": _TEMPLATE_FILE_TRANSFER,
+    "Startup Automation Script": _TEMPLATE_STARTUP,
+}
+
+_CMDLETS = (
+    "Get-Help - Get help for cmdlets",
+    "Get-Command - List available commands",
+    "Get-ChildItem - List directory contents",
+    "Set-Location - Change directory",
+    "Test-Connection - Ping network device",
+    "Get-NetAdapter - Show network adapters",
+    "New-Item - Create file/folder",
+    "Copy-Item - Copy files",
+    "Remove-Item - Delete files",
+    "Start-Process - Launch programs",
+)
+
+# (device, IP) rows of the Broetje Network Devices table
+_BROETJE_DEVICES = (
+    ("NCU Controller", "192.168.214.1"),
+    ("Service PC", "192.168.214.34"),
+    ("Operator PC", "192.168.214.35"),
+    ("Scale PC", "192.168.214.37"),
+    ("Riveter PC", "192.168.214.60"),
+    ("RTX System", "192.168.213.33"),
+)
+
+# Script name fragment -> task completed by saving a script with that name,
+# checked in order
+_SCRIPT_TASKS = (
+    ("OpenHelloWorld", "create_directory_script"),
+    ("NetworkDiagnostic", "network_diagnostic_script"),
+    ("Backup", "backup_management_script"),
+    ("Startup", "startup_automation"),
+)
+_SCRIPT_TASK_IDS = frozenset(task_id for _, task_id in _SCRIPT_TASKS)
+
 class PowerShellScriptingModule(TrainingModule):
     """PowerShell Scripting Training Module"""
     
     def __init__(self, module_data, user_data, db_manager=None):
         self.db_manager = db_manager
+        # Saved scripts by name, in save order
         self.script_outputs = {}
-        self.created_scripts = []
+        # Script tasks whose script has been saved, for validate_task
+        self._completed_script_tasks = set()
         self.cmdlet_history = []
+        self.ps_process = None
+        # Raw bytes up to the last newline seen; a read can end mid UTF-8 character
+        self._ps_stdout_buffer = bytearray()
+        # [end marker, callback, captured lines] per command sent, oldest first;
+        # commands without a callback print to the console
+        self._ps_requests = deque()
         super().__init__(module_data, user_data)
         
     def get_learning_objectives(self) -> list:
@@ -46,7 +344,43 @@ class PowerShellScriptingModule(TrainingModule):
         """Setup module-specific UI elements"""
         layout = QVBoxLayout(parent)
         
-        # PowerShell Console section
+        # Start the shared PowerShell now so its startup overlaps with reading the page
+        self.start_powershell()
+        
+        # The console is built up front; the other tabs are built on first visit
+        self.section_tabs = QTabWidget()
+        layout.addWidget(self.section_tabs)
+        self._pending_sections = {}
+        
+        sections = (
+            ("Console", (self._build_console_section,)),
+            ("Scripts", (self._build_editor_section, self._build_templates_section,
+                         self._build_management_section)),
+            ("Cmdlets", (self._build_cmdlet_section,)),
+            ("Devices", (self._build_devices_section,)),
+        )
+        for title, builders in sections:
+            index = self.section_tabs.addTab(QWidget(), title)
+            self._pending_sections[index] = builders
+        self._ensure_tab_built(0)
+        self.section_tabs.currentChanged.connect(self._ensure_tab_built)
+    
+    def _ensure_tab_built(self, index):
+        """Build a section tab's widgets the first time it is needed"""
+        builders = self._pending_sections.pop(index, None)
+        if builders is not None:
+            layout = QVBoxLayout(self.section_tabs.widget(index))
+            for builder in builders:
+                builder(layout)
+    
+    def _ensure_section_built(self, builder):
+        """Build the tab containing builder, for actions that reach into it"""
+        for index, builders in list(self._pending_sections.items()):
+            if builder in builders:
+                self._ensure_tab_built(index)
+    
+    def _build_console_section(self, layout):
+        """Build the PowerShell console group"""
         console_group = QGroupBox("PowerShell Console")
         console_layout = QVBoxLayout()
         
@@ -66,6 +400,7 @@ class PowerShellScriptingModule(TrainingModule):
         # Console output
         self.console_output = QTextEdit()
         self.console_output.setReadOnly(True)
+        self.console_output.setUndoRedoEnabled(False)
         self.console_output.setFont(QFont("Consolas", 10))
         self.console_output.setStyleSheet("background-color: #012456; color: #F0F0F0;")
         console_layout.addWidget(self.console_output)
@@ -77,8 +412,9 @@ class PowerShellScriptingModule(TrainingModule):
         
         console_group.setLayout(console_layout)
         layout.addWidget(console_group)
-        
-        # Script Editor section
+    
+    def _build_editor_section(self, layout):
+        """Build the script editor group"""
         editor_group = QGroupBox("Script Editor")
         editor_layout = QVBoxLayout()
         
@@ -120,19 +456,14 @@ class PowerShellScriptingModule(TrainingModule):
         
         editor_group.setLayout(editor_layout)
         layout.addWidget(editor_group)
-        
-        # Script Templates section
+    
+    def _build_templates_section(self, layout):
+        """Build the script templates group"""
         templates_group = QGroupBox("Script Templates")
         templates_layout = QVBoxLayout()
         
         template_combo = QComboBox()
-        template_combo.addItems([
-            "Basic Hello World Script",
-            "Network Diagnostic Script",
-            "Backup Management Script",
-            "File Transfer Script",
-            "Startup Automation Script"
-        ])
+        template_combo.addItems(list(_TEMPLATES))
         templates_layout.addWidget(template_combo)
         
         insert_template_button = QPushButton("Insert Template")
@@ -143,25 +474,18 @@ class PowerShellScriptingModule(TrainingModule):
         
         templates_group.setLayout(templates_layout)
         layout.addWidget(templates_group)
-        
-        # Cmdlet Reference section
+    
+    def _build_cmdlet_section(self, layout):
+        """Build the cmdlet reference group"""
         cmdlet_group = QGroupBox("Common Cmdlets")
         cmdlet_layout = QVBoxLayout()
         
         self.cmdlet_list = QListWidget()
-        cmdlets = [
-            "Get-Help - Get help for cmdlets",
-            "Get-Command - List available commands",
-            "Get-ChildItem - List directory contents",
-            "Set-Location - Change directory",
-            "Test-Connection - Ping network device",
-            "Get-NetAdapter - Show network adapters",
-            "New-Item - Create file/folder",
-            "Copy-Item - Copy files",
-            "Remove-Item - Delete files",
-            "Start-Process - Launch programs"
-        ]
-        self.cmdlet_list.addItems(cmdlets)
+        for text in _CMDLETS:
+            # Keep the bare cmdlet name with the item for insert and help
+            item = QListWidgetItem(text)
+            item.setData(Qt.UserRole, text.split(' - ', 1)[0])
+            self.cmdlet_list.addItem(item)
         self.cmdlet_list.itemDoubleClicked.connect(self.insert_cmdlet)
         cmdlet_layout.addWidget(self.cmdlet_list)
         
@@ -171,8 +495,9 @@ class PowerShellScriptingModule(TrainingModule):
         
         cmdlet_group.setLayout(cmdlet_layout)
         layout.addWidget(cmdlet_group)
-        
-        # Broetje-specific section
+    
+    def _build_devices_section(self, layout):
+        """Build the Broetje network devices group"""
         broetje_group = QGroupBox("Broetje Network Devices")
         broetje_layout = QVBoxLayout()
         
@@ -181,16 +506,7 @@ class PowerShellScriptingModule(TrainingModule):
         self.device_table.setHorizontalHeaderLabels(["Device", "IP Address", "Status"])
         
         # Add Broetje devices
-        devices = [
-            ("NCU Controller", "192.168.214.1"),
-            ("Service PC", "192.168.214.34"),
-            ("Operator PC", "192.168.214.35"),
-            ("Scale PC", "192.168.214.37"),
-            ("Riveter PC", "192.168.214.60"),
-            ("RTX System", "192.168.213.33")
-        ]
-        
-        for i, (device, ip) in enumerate(devices):
+        for i, (device, ip) in enumerate(_BROETJE_DEVICES):
             self.device_table.insertRow(i)
             self.device_table.setItem(i, 0, QTableWidgetItem(device))
             self.device_table.setItem(i, 1, QTableWidgetItem(ip))
@@ -204,8 +520,9 @@ class PowerShellScriptingModule(TrainingModule):
         
         broetje_group.setLayout(broetje_layout)
         layout.addWidget(broetje_group)
-        
-        # Script Management section
+    
+    def _build_management_section(self, layout):
+        """Build the script management group"""
         management_group = QGroupBox("Script Management")
         management_layout = QVBoxLayout()
         
@@ -237,60 +554,183 @@ class PowerShellScriptingModule(TrainingModule):
         # Add to history
         self.cmdlet_history.append(command)
         
-        # Display command
-        self.console_output.append(f"PS> {command}")
+        if self.ps_process is not None:
+            # Display command
+            self._emit(f"PS> {command}")
+            self.send_to_powershell(command)
+            self._complete_task("powershell_basics")
+            self.command_input.clear()
+            return
+        
+        # Collect the simulated output so the console is updated once
+        lines = [f"PS> {command}"]
         
         # Simulate command execution
         try:
-            if command.lower().startswith("get-help"):
-                self.show_help_output(command)
-            elif command.lower().startswith("test-connection"):
-                self.simulate_test_connection(command)
-            elif command.lower() == "get-location":
-                self.console_output.append("Path\n----\nD:\\Temp\\YourInitials\\PowerShellScripts")
-            elif command.lower() == "get-childitem":
-                self.simulate_dir_listing()
+            lowered = command.lower()
+            if lowered.startswith("get-help"):
+                output = self.simulate_help_output(command)
+            elif lowered.startswith("test-connection"):
+                output = self.simulate_test_connection(command)
+            elif lowered == "get-location":
+                output = "Path\n----\nD:\\Temp\\YourInitials\\PowerShellScripts"
+            elif lowered == "get-childitem":
+                output = self.simulate_dir_listing()
             else:
                 # Generic command simulation
-                self.console_output.append(f"Executing: {command}")
-                self.console_output.append("Command completed successfully.")
+                output = f"Executing: {command}\nCommand completed successfully."
+            if output:
+                lines.append(output)
             
-            self.task_widgets.get("powershell_basics").set_completed(True)
+            self._complete_task("powershell_basics")
             
         except Exception as e:
-            self.console_output.append(f"Error: {str(e)}")
+            lines.append(f"Error: {str(e)}")
         
         self.command_input.clear()
-        self.console_output.append("")
-    
-    def show_help_output(self, command):
-        """Show help output for cmdlet"""
-        parts = command.split()
-        if len(parts) > 1:
-            cmdlet = parts[1]
-            help_text = f"""
-NAME
-    {cmdlet}
-
-SYNOPSIS
-    Gets help information for PowerShell cmdlets
-
-SYNTAX
-    {cmdlet} [[-Name] <String>] [-Full] [-Examples]
-
-DESCRIPTION
-    The {cmdlet} cmdlet displays information about PowerShell concepts and commands.
-
-EXAMPLES
-    {cmdlet} Get-Process
-    {cmdlet} Get-Process -Full
-            """
-            self.console_output.append(help_text)
+        lines.append("")
+        self._emit("\n".join(lines))
+    
+    def _complete_task(self, task_id):
+        """Mark a task complete unless its widget already shows it as complete"""
+        widget = self.task_widgets.get(task_id)
+        if widget is not None and not widget.completed:
+            widget.set_completed(True)
+    
+    def _emit(self, text):
+        """Add text to the console as a new paragraph with one cursor insert"""
+        cursor = self.console_output.textCursor()
+        cursor.movePosition(QTextCursor.End)
+        if not self.console_output.document().isEmpty():
+            cursor.insertBlock()
+        cursor.insertText(text)
+        # Keep the newest output in view
+        self.console_output.setTextCursor(cursor)
+    
+    def start_powershell(self):
+        """Launch the PowerShell process shared by the console and script runs"""
+        if _PS_EXECUTABLE is None:
+            return
+        
+        self.ps_process = QProcess(self)
+        self.ps_process.readyReadStandardOutput.connect(self.read_powershell_output)
+        self.ps_process.readyReadStandardError.connect(self.read_powershell_error)
+        self.ps_process.errorOccurred.connect(self.powershell_error)
+        self.ps_process.finished.connect(self.powershell_finished)
+        self.ps_process.start(_PS_EXECUTABLE, [*_PS_FLAGS, "-Command", "-"])
+        self.ps_process.write(_PS_SETUP.encode())
+    
+    def send_to_powershell(self, code, on_output=None):
+        """Run code in the shared PowerShell session, followed by its end marker
+        
+        Output goes to the console, or is collected and passed to on_output as
+        one string once the command finishes.
+        """
+        marker = _PS_END_MARKER.format(token=uuid.uuid4().hex)
+        self._ps_requests.append([marker, on_output, []])
+        
+        # Base64 keeps multi-line scripts on one stdin line. Console input is
+        # dot-sourced so its variables persist; internal commands get their own scope
+        operator = "." if on_output is None else "&"
+        encoded = base64.b64encode(code.encode('utf-8')).decode('ascii')
+        self.ps_process.write(
+            f"{operator} ([scriptblock]::Create([Text.Encoding]::UTF8.GetString("
+            f"[Convert]::FromBase64String('{encoded}'))))\n"
+            f"Write-Output '{marker}'\n".encode()
+        )
+    
+    def read_powershell_output(self):
+        """Route complete lines of PowerShell output to the console or their caller"""
+        # QProcess drains the pipe as data arrives; take everything buffered in one call
+        self._ps_stdout_buffer += self.ps_process.readAllStandardOutput().data()
+        end = self._ps_stdout_buffer.rfind(b'\n')
+        if end < 0:
+            return
+        lines = self._ps_stdout_buffer[:end].decode('utf-8', errors='replace').split('\n')
+        del self._ps_stdout_buffer[:end + 1]
+        
+        output = []
+        for line in lines:
+            line = line.rstrip('\r')
+            request = self._ps_requests[0] if self._ps_requests else None
+            if request is not None and line == request[0]:
+                self._ps_requests.popleft()
+                if request[1] is None:
+                    output.append("")
+                else:
+                    request[1]("\n".join(request[2]))
+            elif request is not None and request[1] is not None:
+                request[2].append(line)
+            else:
+                output.append(line)
+        if output:
+            self._emit("\n".join(output))
+    
+    def read_powershell_error(self):
+        """Display PowerShell error output"""
+        data = self.ps_process.readAllStandardError().data().decode('utf-8', errors='replace')
+        self._emit(data.rstrip())
+    
+    def powershell_error(self, error):
+        """Fall back to the simulated console if PowerShell fails to start or crashes"""
+        if error in (QProcess.FailedToStart, QProcess.Crashed):
+            self._drop_powershell()
+    
+    def powershell_finished(self, exit_code, exit_status):
+        """Fall back to the simulated console once the session has exited"""
+        if self._drop_powershell():
+            self._emit("PowerShell session ended; commands now run in the simulated console.")
+    
+    def _drop_powershell(self):
+        """Forget the PowerShell session and anything still waiting on it"""
+        process, self.ps_process = self.ps_process, None
+        if process is None:
+            return False
+        
+        # Queued requests will never see their end marker
+        self._ps_requests.clear()
+        self._ps_stdout_buffer.clear()
+        process.deleteLater()
+        return True
+    
+    def stop_powershell(self):
+        """Ask PowerShell to exit, then kill its process tree if it does not"""
+        process = self.ps_process
+        if process is None or process.state() == QProcess.NotRunning:
+            return
+        
+        # Exiting on purpose is not worth a console message
+        process.finished.disconnect(self.powershell_finished)
+        self._drop_powershell()
+        
+        process.write(b"exit\n")
+        if process.waitForFinished(1000):
+            return
+        
+        # A plain kill would leave processes started by the script running
+        if os.name == 'nt':
+            subprocess.run(["taskkill", "/T", "/F", "/PID", str(process.processId())],
+                           capture_output=True)
+        else:
+            process.kill()
+        process.waitForFinished(1000)
+    
+    def shutdown(self):
+        """Shut down the PowerShell session when the module window closes"""
+        self.stop_powershell()
+        super().shutdown()
+    
+    def simulate_help_output(self, command):
+        """Return simulated help output for cmdlet"""
+        _, _, arguments = command.partition(' ')
+        cmdlet = arguments.lstrip().partition(' ')[0]
+        if cmdlet:
+            return _HELP_TEMPLATE.format(cmdlet=cmdlet)
+        return None
     
     def simulate_test_connection(self, command):
-        """Simulate Test-Connection output"""
-        import re
-        match = re.search(r'\b(?:\d{1,3}\.){3}\d{1,3}\b', command)
+        """Return simulated Test-Connection output"""
+        match = _IPV4_RE.search(command)
         
         if match:
             ip = match.group()
@@ -302,10 +742,11 @@ LOCALHOST     {ip}      {ip}                                               32
 LOCALHOST     {ip}      {ip}                                               32       1       
 LOCALHOST     {ip}      {ip}                                               32       1       
             """
-            self.console_output.append(output)
+            return output
+        return None
     
     def simulate_dir_listing(self):
-        """Simulate directory listing"""
+        """Return a simulated directory listing"""
         output = """
     Directory: D:\\Temp\\YourInitials\\PowerShellScripts
 
@@ -315,7 +756,7 @@ Mode                 LastWriteTime         Length Name
 -a----         1/19/2025   2:45 PM            512 NetworkDiagnostic.ps1
 -a----         1/19/2025   3:00 PM             42 Hello_World.txt
         """
-        self.console_output.append(output)
+        return output
     
     def save_script(self):
         """Save current script"""
@@ -330,23 +771,18 @@ Mode                 LastWriteTime         Length Name
         
         script_content = self.script_editor.toPlainText()
         
+        # Update scripts list; saving over an existing script keeps its entry
+        if script_name not in self.script_outputs:
+            self.scripts_list.addItem(script_name)
+        
         # Save to virtual environment
         self.script_outputs[script_name] = script_content
-        self.created_scripts.append(script_name)
-        
-        # Update scripts list
-        self.scripts_list.clear()
-        self.scripts_list.addItems(self.created_scripts)
         
         # Mark task complete based on script name
-        if "OpenHelloWorld" in script_name:
-            self.task_widgets.get("create_directory_script").set_completed(True)
-        elif "NetworkDiagnostic" in script_name:
-            self.task_widgets.get("network_diagnostic_script").set_completed(True)
-        elif "Backup" in script_name:
-            self.task_widgets.get("backup_management_script").set_completed(True)
-        elif "Startup" in script_name:
-            self.task_widgets.get("startup_automation").set_completed(True)
+        matched = [task_id for fragment, task_id in _SCRIPT_TASKS if fragment in script_name]
+        self._completed_script_tasks.update(matched)
+        if matched:
+            self._complete_task(matched[0])
         
         QMessageBox.information(self, "Script Saved", 
                               f"Script '{script_name}' has been saved.")
@@ -360,288 +796,116 @@ Mode                 LastWriteTime         Length Name
                               "Please write a script before running.")
             return
         
-        self.console_output.append("\n=== Running Script ===\n")
+        self._emit("\n=== Running Script ===\n")
+        
+        if self.ps_process is not None:
+            self.send_to_powershell(script_content)
+            return
         
         # Simulate script execution based on content
         if "Hello_World.txt" in script_content:
-            self.console_output.append("Opening Hello World file...")
-            self.console_output.append("File opened successfully!")
+            output = "Opening Hello World file...\nFile opened successfully!"
         elif "Test-Connection" in script_content:
-            self.console_output.append("Testing connectivity to Broetje devices...")
+            self._emit("Testing connectivity to Broetje devices...")
             self.test_all_devices()
+            output = None
         elif "New-BroetjeBackup" in script_content:
-            self.console_output.append("Creating backup: AP1741_R1_NC_20250119")
-            self.console_output.append("Backup completed successfully.")
+            output = "Creating backup: AP1741_R1_NC_20250119\nBackup completed successfully."
         else:
-            self.console_output.append("Script executed successfully.")
+            output = "Script executed successfully."
         
-        self.console_output.append("\n=== Script Complete ===\n")
+        if output:
+            self._emit(f"{output}\n\n=== Script Complete ===\n")
+        else:
+            self._emit("\n=== Script Complete ===\n")
     
     def load_script_template(self):
         """Load a script template"""
-        templates = {
-            "Basic": self.get_basic_template(),
-            "Network": self.get_network_template(),
-            "Backup": self.get_backup_template(),
-            "Startup": self.get_startup_template()
-        }
-        
         # For demonstration, load the basic template
-        self.script_editor.setText(self.get_basic_template())
+        self.script_editor.setText(_TEMPLATE_BASIC)
     
     def insert_template(self, template_name):
         """Insert selected template"""
-        if "Hello World" in template_name:
-            self.script_editor.setText(self.get_basic_template())
-        elif "Network Diagnostic" in template_name:
-            self.script_editor.setText(self.get_network_template())
-        elif "Backup Management" in template_name:
-            self.script_editor.setText(self.get_backup_template())
-        elif "File Transfer" in template_name:
-            self.script_editor.setText(self.get_file_transfer_template())
-        elif "Startup" in template_name:
-            self.script_editor.setText(self.get_startup_template())
-    
-    def get_basic_template(self):
-        """Get basic PowerShell template"""
-        return """# OpenHelloWorld.ps1
-# Clear screen
-Clear-Host
-
-# Display message
-Write-Host "Opening Hello World file..." -ForegroundColor Green
-
-# Define file path
-$filePath = "D:\\Temp\\$env:USERNAME\\PowerShellScripts\\Hello_World.txt"
-
-# Check if file exists
-if (Test-Path $filePath) {
-    # Open file in Notepad
-    Start-Process notepad.exe -ArgumentList $filePath
-    Write-Host "File opened successfully!" -ForegroundColor Green
-} else {
-    Write-Host "File not found: $filePath" -ForegroundColor Red
-}
-
-# Pause for user input
-Read-Host "Press Enter to exit"
-"""
-    
-    def get_network_template(self):
-        """Get network diagnostic template"""
-        return """# Broetje-NetworkDiagnostics.ps1
-param(
-    [string]$OutputPath = "D:\\Temp\\$env:USERNAME\\NetworkDiagnostics.txt"
-)
-
-# Define Broetje network devices
-$broetjeDevices = @{
-    "NCU Controller" = "192.168.214.1"
-    "Service PC" = "192.168.214.34"
-    "Operator PC" = "192.168.214.35"
-    "Scale PC (Vision)" = "192.168.214.37"
-    "Riveter PC" = "192.168.214.60"
-    "RTX System" = "192.168.213.33"
-}
-
-# Initialize report
-$report = @()
-$report += "=================================="
-$report += "Broetje Network Diagnostic Report"
-$report += "Date: $(Get-Date)"
-$report += "=================================="
-
-# Test each device
-foreach ($device in $broetjeDevices.GetEnumerator()) {
-    Write-Host "Testing $($device.Key)..." -ForegroundColor Yellow
-    
-    try {
-        $ping = Test-Connection -ComputerName $device.Value -Count 1 -ErrorAction Stop
-        $status = "ONLINE"
-        $responseTime = "$($ping.ResponseTime)ms"
-        $color = "Green"
-    }
-    catch {
-        $status = "OFFLINE"
-        $responseTime = "N/A"
-        $color = "Red"
-    }
-    
-    $line = "$($device.Key.PadRight(20)) $($device.Value.PadRight(15)) $status $responseTime"
-    $report += $line
-    Write-Host $line -ForegroundColor $color
-}
-
-# Save report
-$report | Out-File -FilePath $OutputPath -Encoding utf8
-Write-Host "`nReport saved to: $OutputPath" -ForegroundColor Cyan
-
-# Open report
-Start-Process notepad.exe -ArgumentList $OutputPath
-"""
-    
-    def get_backup_template(self):
-        """Get backup management template"""
-        return """# Broetje-BackupManager.ps1
-function New-BroetjeBackup {
-    param(
-        [Parameter(Mandatory)]
-        [string]$MachineNumber,
-        
-        [Parameter(Mandatory)]
-        [string]$MachineInitials,
-        
-        [Parameter(Mandatory)]
-        [ValidateSet('NC','DD','HMI','PLC','S7')]
-        [string]$BackupType,
-        
-        [string]$SourcePath = "C:\\Data",
-        [string]$DestinationPath = "\\\\server\\backups"
-    )
-    
-    # Generate backup filename
-    $date = Get-Date -Format "yyyyMMdd"
-    $backupName = "${MachineNumber}_${MachineInitials}_${BackupType}_${date}"
-    
-    # Create destination directory
-    $destDir = Join-Path $DestinationPath $MachineNumber
-    if (!(Test-Path $destDir)) {
-        New-Item -Path $destDir -ItemType Directory -Force
-    }
-    
-    # Define backup destination
-    $destFile = Join-Path $destDir "${backupName}.zip"
-    
-    Write-Host "Creating backup: $backupName" -ForegroundColor Green
-    
-    try {
-        # Compress source to destination
-        Compress-Archive -Path $SourcePath -DestinationPath $destFile -Force
-        
-        Write-Host "Backup completed: $destFile" -ForegroundColor Green
-        return $destFile
-    }
-    catch {
-        Write-Host "Backup failed: $_" -ForegroundColor Red
-        return $null
-    }
-}
-
-# Example usage
-New-BroetjeBackup -MachineNumber "AP1741" -MachineInitials "R1" -BackupType "NC"
-"""
-    
-    def get_file_transfer_template(self):
-        """Get file transfer template"""
-        return """# Broetje-FileTransfer.ps1
-function Copy-ToMachine {
-    param(
-        [Parameter(Mandatory)]
-        [string]$SourceFile,
-        
-        [Parameter(Mandatory)]
-        [string]$TargetIP,
-        
-        [string]$RemotePath = "C:\\Temp",
-        [PSCredential]$Credential
-    )
-    
-    Write-Host "Transferring file to $TargetIP..." -ForegroundColor Cyan
-    
-    try {
-        # Test network connectivity
-        if (!(Test-Connection -ComputerName $TargetIP -Count 1 -Quiet)) {
-            throw "Cannot reach target machine: $TargetIP"
-        }
-        
-        # Build UNC path
-        $uncPath = "\\\\$TargetIP\\$(($RemotePath).Replace(':', '$'))"
-        
-        # Copy file
-        Copy-Item -Path $SourceFile -Destination $uncPath -Force
-        
-        Write-Host "File transferred successfully!" -ForegroundColor Green
-    }
-    catch {
-        Write-Host "Transfer failed: $_" -ForegroundColor Red
-    }
-}
-
-# Example usage
-Copy-ToMachine -SourceFile "D:\\Temp\\test.txt" -TargetIP "192.168.214.35"
-"""
-    
-    def get_startup_template(self):
-        """Get startup script template"""
-        return """# Startup-BroetjeTasks.ps1
-# This runs when user logs in
-
-# Set up logging
-$logFile = "D:\\Temp\\$env:USERNAME\\startup_log.txt"
-Add-Content $logFile "$(Get-Date): Startup script initiated"
-
-# Wait for network
-Start-Sleep -Seconds 5
-
-# Test critical connections
-$criticalIPs = @("192.168.214.1", "192.168.214.34", "192.168.214.60")
-foreach ($ip in $criticalIPs) {
-    if (Test-Connection -ComputerName $ip -Count 1 -Quiet) {
-        Add-Content $logFile "$(Get-Date): $ip - ONLINE"
-    } else {
-        Add-Content $logFile "$(Get-Date): $ip - OFFLINE"
-    }
-}
-
-# Open Hello World file
-$helloFile = "D:\\Temp\\$env:USERNAME\\PowerShellScripts\\Hello_World.txt"
-if (Test-Path $helloFile) {
-    Start-Process notepad.exe -ArgumentList $helloFile
-    Add-Content $logFile "$(Get-Date): Opened Hello World file"
-}
-
-Add-Content $logFile "$(Get-Date): Startup script completed"
-"""
+        text = _TEMPLATES.get(template_name)
+        if text:
+            self.script_editor.setText(text)
     
     def insert_cmdlet(self, item):
         """Insert cmdlet into console"""
-        cmdlet = item.text().split(' - ')[0]
-        self.command_input.setText(cmdlet)
+        self.command_input.setText(item.data(Qt.UserRole))
     
     def get_cmdlet_help(self):
         """Get help for selected cmdlet"""
         current_item = self.cmdlet_list.currentItem()
         if current_item:
-            cmdlet = current_item.text().split(' - ')[0]
-            self.command_input.setText(f"Get-Help {cmdlet}")
+            self.command_input.setText(f"Get-Help {current_item.data(Qt.UserRole)}")
             self.execute_command()
     
     def test_all_devices(self):
         """Test all Broetje devices"""
-        self.console_output.append("\nTesting all Broetje devices...\n")
+        # Script runs can get here before the Devices tab has been opened
+        self._ensure_section_built(self._build_devices_section)
+        self._emit("\nTesting all Broetje devices...\n")
         
-        for row in range(self.device_table.rowCount()):
-            device = self.device_table.item(row, 0).text()
-            ip = self.device_table.item(row, 1).text()
-            
+        devices = [
+            (row, self.device_table.item(row, 0).text(), self.device_table.item(row, 1).text())
+            for row in range(self.device_table.rowCount())
+        ]
+        
+        if self.ps_process is None:
             # Simulate test
-            import random
-            success = random.choice([True, True, True, False])  # 75% success rate
-            
-            if success:
-                status = "Online"
-                color = Qt.green
-                self.console_output.append(f"{device} ({ip}) - ONLINE (1ms)")
-            else:
-                status = "Offline"
-                color = Qt.red
-                self.console_output.append(f"{device} ({ip}) - OFFLINE")
-            
-            status_item = QTableWidgetItem(status)
-            status_item.setForeground(color)
-            self.device_table.setItem(row, 2, status_item)
+            self.show_device_results(devices, {
+                ip: 1 for _, _, ip in devices
+                if _rand.getrandbits(2) != 0  # 75% success rate
+            })
+            return
         
-        self.console_output.append("\nDevice testing complete.\n")
+        # The shared session pings every device in one command; the JSON
+        # replies come back through device_test_finished
+        ips = ",".join("'" + ip.replace("'", "''") + "'" for _, _, ip in devices)
+        self.send_to_powershell(
+            _PS_DEVICE_TEST.format(ips=ips),
+            lambda output: self.device_test_finished(output.strip(), devices)
+        )
+    
+    def device_test_finished(self, output, devices):
+        """Parse the batched ping replies"""
+        try:
+            replies = json.loads(output) if output else []
+        except ValueError:
+            replies = []
+        # ConvertTo-Json emits a bare object for a single reply
+        if isinstance(replies, dict):
+            replies = [replies]
+        
+        self.show_device_results(devices, {
+            reply.get('Ip'): reply.get('Ms') for reply in replies if isinstance(reply, dict)
+        })
+    
+    def show_device_results(self, devices, online):
+        """Update the device table and console from a mapping of online IP to response ms"""
+        lines = []
+        self.device_table.setUpdatesEnabled(False)
+        try:
+            for row, device, ip in devices:
+                if ip in online:
+                    status = "Online"
+                    color = Qt.green
+                    lines.append(f"{device} ({ip}) - ONLINE ({online[ip]}ms)")
+                else:
+                    status = "Offline"
+                    color = Qt.red
+                    lines.append(f"{device} ({ip}) - OFFLINE")
+                
+                # Update the seeded status cell in place rather than replacing it
+                status_item = self.device_table.item(row, 2)
+                status_item.setText(status)
+                status_item.setForeground(color)
+        finally:
+            self.device_table.setUpdatesEnabled(True)
+        
+        lines.append("\nDevice testing complete.\n")
+        self._emit("\n".join(lines))
     
     def schedule_script(self):
         """Schedule selected script"""
@@ -655,7 +919,7 @@ Add-Content $logFile "$(Get-Date): Startup script completed"
         
         # Simulate scheduling
         schedule_cmd = f"""
-$action = New-ScheduledTaskAction -Execute "PowerShell.exe" -Argument "-File '{script_name}'"
+$action = New-ScheduledTaskAction -Execute "PowerShell.exe" -Argument "{' '.join(_PS_FLAGS)} -File '{script_name}'"
 $trigger = New-ScheduledTaskTrigger -AtLogOn
 $principal = New-ScheduledTaskPrincipal -UserId $env:USERNAME
 $settings = New-ScheduledTaskSettingsSet -AllowStartIfOnBatteries
@@ -663,16 +927,14 @@ $settings = New-ScheduledTaskSettingsSet -AllowStartIfOnBatteries
 Register-ScheduledTask -TaskName "BroetjeStartup" -Action $action -Trigger $trigger -Principal $principal -Settings $settings
 """
         
-        self.console_output.append("\n=== Scheduling Script ===")
-        self.console_output.append(schedule_cmd)
-        self.console_output.append("Task scheduled successfully.\n")
+        self._emit(f"\n=== Scheduling Script ===\n{schedule_cmd}\nTask scheduled successfully.\n")
         
         QMessageBox.information(self, "Script Scheduled", 
                               f"Script '{script_name}' has been scheduled to run at logon.")
     
     def export_scripts(self):
         """Export all created scripts"""
-        if not self.created_scripts:
+        if not self.script_outputs:
             QMessageBox.warning(self, "No Scripts", 
                               "No scripts to export.")
             return
@@ -681,15 +943,53 @@ Register-ScheduledTask -TaskName "BroetjeStartup" -Action $action -Trigger $trig
             self, "Select Export Directory"
         )
         
-        if export_dir:
-            for script_name in self.created_scripts:
-                script_content = self.script_outputs.get(script_name, "")
-                
-                # Simulate export
-                self.console_output.append(f"Exported: {script_name} to {export_dir}")
+        if not export_dir:
+            return
+        
+        scripts = list(self.script_outputs.items())
+        progress = QProgressDialog("Exporting scripts...", "Cancel", 0, len(scripts), self)
+        progress.setWindowModality(Qt.WindowModal)
+        
+        exported, failed = [], []
+        # Write the files concurrently; the dialog is advanced from this thread
+        with ThreadPoolExecutor(max_workers=min(8, len(scripts))) as executor:
+            futures = {
+                # utf-8-sig so Windows PowerShell 5.1 reads non-ASCII text correctly.
+                # Only the final name component is used so nothing lands outside export_dir
+                executor.submit(Path(export_dir, PureWindowsPath(script_name).name).write_text,
+                                script_content, encoding='utf-8-sig'): script_name
+                for script_name, script_content in scripts
+            }
             
+            def cancel_pending():
+                # Files already being written finish; the rest are skipped
+                for future in futures:
+                    future.cancel()
+            progress.canceled.connect(cancel_pending)
+            
+            for future in as_completed(futures):
+                script_name = futures[future]
+                if future.cancelled():
+                    continue
+                if future.exception() is None:
+                    exported.append(script_name)
+                else:
+                    failed.append(f"{script_name}: {future.exception()}")
+                progress.setValue(progress.value() + 1)
+        progress.close()
+        
+        lines = ([f"Exported: {script_name} to {export_dir}" for script_name in exported] +
+                 [f"Export failed: {error}" for error in failed])
+        if lines:
+            self._emit("\n".join(lines))
+        
+        if failed:
+            QMessageBox.warning(self, "Export Incomplete", 
+                              f"Exported {len(exported)} of {len(scripts)} scripts to {export_dir}.\n\n" +
+                              "\n".join(failed))
+        else:
             QMessageBox.information(self, "Export Complete", 
-                                  f"Exported {len(self.created_scripts)} scripts to {export_dir}")
+                                  f"Exported {len(exported)} scripts to {export_dir}")
     
     def validate_task(self, task_id: str) -> bool:
         """Validate specific task completion"""
@@ -697,21 +997,9 @@ Register-ScheduledTask -TaskName "BroetjeStartup" -Action $action -Trigger $trig
             # Check if basic commands were executed
             return len(self.cmdlet_history) >= 3
         
-        elif task_id == "create_directory_script":
-            # Check if OpenHelloWorld script was created
-            return any("OpenHelloWorld" in script for script in self.created_scripts)
-        
-        elif task_id == "network_diagnostic_script":
-            # Check if network diagnostic script was created
-            return any("NetworkDiagnostic" in script for script in self.created_scripts)
-        
-        elif task_id == "backup_management_script":
-            # Check if backup script was created
-            return any("Backup" in script for script in self.created_scripts)
-        
-        elif task_id == "startup_automation":
-            # Check if startup script was created and scheduled
-            return any("Startup" in script for script in self.created_scripts)
+        elif task_id in _SCRIPT_TASK_IDS:
+            # Check if the matching script was created
+            return task_id in self._completed_script_tasks
         
         return True
     
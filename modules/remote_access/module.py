@@ -5,18 +5,94 @@ Interactive module for teaching UltraVNC and Teams remote access setup
 """
 
 import os
+import json
+import time
+import socket
+import random
 import subprocess
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QTextEdit, QLineEdit, QMessageBox, QGroupBox, QCheckBox,
     QTableWidget, QTableWidgetItem, QHeaderView, QComboBox,
-    QRadioButton, QButtonGroup, QSpinBox
+    QRadioButton, QButtonGroup, QSpinBox, QTabWidget
 )
-from PySide6.QtCore import Qt, QTimer, Signal
-from PySide6.QtGui import QFont
-from training_module import TrainingModule
+from PySide6.QtCore import Qt, QTimer, Signal, QSignalBlocker
+from PySide6.QtGui import QFont, QBrush
+from PySide6.QtNetwork import QTcpSocket
+from training_module import TrainingModule, LazySection
+
+_SERVER_IP_CACHE_TTL = 30.0
+_MACHINE_NETWORK_GATEWAY = "192.168.214.1"
+
+# Expected type of each saved VNC setting; passwords are never written to disk
+_VNC_CONFIG_TYPES = MappingProxyType({
+    'port': int,
+    'display': str,
+    'loopback': bool,
+    'all_interfaces': bool
+})
+
+_OK_HTML = '<span style="color: #27ae60;">Connection to {}:{} - Success</span>'
+_FAIL_HTML = '<span style="color: #e74c3c;">Connection to {}:{} - Failed</span>'
+
+_OK_BRUSH = QBrush(Qt.green)
+_FAIL_BRUSH = QBrush(Qt.red)
+_HISTORY_LIMIT = 500
+
+_INSTALL_STEPS = (
+    ('download', "Downloaded UltraVNC installer"),
+    ('admin', "Running as Administrator"),
+    ('server', "VNC Server component selected"),
+    ('service', "Registered as system service"),
+    ('firewall', "Windows Firewall exception added")
+)
+
+_TEAMS_STEPS = (
+    ('teams_installed', "Teams installed and logged in"),
+    ('camera_configured', "Camera configured"),
+    ('microphone_configured', "Microphone configured"),
+    ('screen_sharing_tested', "Screen sharing tested"),
+    ('remote_control_enabled', "Remote control permissions set")
+)
+
+_RESOURCES = MappingProxyType({
+    "documents": (
+        {
+            "title": "Remote Access Guide",
+            "path": "resources/remote_access_guide.md",
+            "type": "markdown"
+        },
+    ),
+    "links": (
+        {
+            "title": "UltraVNC Documentation",
+            "url": "https://uvnc.com/docs/",
+            "description": "Official UltraVNC documentation"
+        },
+        {
+            "title": "Teams Remote Control",
+            "url": "https://support.microsoft.com/en-us/office/share-your-screen-in-a-teams-meeting",
+            "description": "Microsoft Teams screen sharing guide"
+        }
+    ),
+    "tips": (
+        "Always use strong passwords for VNC",
+        "Configure firewall exceptions properly",
+        "Test connections before field deployment",
+        "Document all remote access configurations",
+        "Consider using VPN for extra security",
+        "Keep VNC software updated"
+    ),
+    "troubleshooting": MappingProxyType({
+        "Connection refused": "Check firewall settings and VNC service status",
+        "Authentication failed": "Verify password is correct (ae746)",
+        "Black screen": "Check display settings and user permissions",
+        "Slow performance": "Adjust color depth and encoding settings"
+    })
+})
 
 class RemoteAccessModule(TrainingModule):
     """Remote Access Configuration Training Module"""
@@ -26,6 +102,25 @@ class RemoteAccessModule(TrainingModule):
         self.vnc_config = {}
         self.teams_config = {}
         self.connection_history = []
+        self._install_timer = None
+        self._local_ok = False
+        self._remote_ok = False
+        # Totals stay None until the checklists exist, so nothing reads as done
+        self._install_checked_count = 0
+        self._install_total = None
+        self._teams_checked_count = 0
+        self._teams_total = None
+        self._server_ip_cache = None
+        self.history_table = None
+        self._save_timer = None
+        self._vnc_password_ok = False
+        # Config and history survive restarts, one file per user and module,
+        # kept next to the training database rather than in the working directory
+        data_dir = (Path(db_manager.db_path).resolve().parent if db_manager is not None
+                    else Path(__file__).resolve().parents[2])
+        self._state_path = (data_dir / "module_state" / module_data['id']
+                            / f"{user_data['id']}.json")
+        self._load_state()
         super().__init__(module_data, user_data)
         
     def get_learning_objectives(self) -> list:
@@ -45,6 +140,15 @@ class RemoteAccessModule(TrainingModule):
         """Setup module-specific UI elements"""
         layout = QVBoxLayout(parent)
         
+        # Resolve task widgets once instead of on every slot call
+        task_widgets = getattr(self, 'task_widgets', {})
+        self._tw_install_vnc = task_widgets.get("install_vnc_server")
+        self._tw_vnc_password = task_widgets.get("configure_vnc_password")
+        self._tw_network_config = task_widgets.get("network_configuration")
+        self._tw_local_test = task_widgets.get("test_local_connection")
+        self._tw_remote_test = task_widgets.get("remote_connection_test")
+        self._tw_teams_config = task_widgets.get("teams_configuration")
+        
         # VNC Installation section
         vnc_install_group = QGroupBox("UltraVNC Installation")
         vnc_install_layout = QVBoxLayout()
@@ -57,17 +161,19 @@ class RemoteAccessModule(TrainingModule):
         vnc_install_layout.addLayout(install_status_layout)
         
         # Installation checklist
-        self.install_checklist = {
-            'download': QCheckBox("Downloaded UltraVNC installer"),
-            'admin': QCheckBox("Running as Administrator"),
-            'server': QCheckBox("VNC Server component selected"),
-            'service': QCheckBox("Registered as system service"),
-            'firewall': QCheckBox("Windows Firewall exception added")
-        }
+        self._install_keys = tuple(key for key, _ in _INSTALL_STEPS)
+        self._install_boxes = [QCheckBox(label) for _, label in _INSTALL_STEPS]
         
-        for step, checkbox in self.install_checklist.items():
+        self._install_total = len(self._install_boxes)
+        for checkbox in self._install_boxes:
             vnc_install_layout.addWidget(checkbox)
-            checkbox.stateChanged.connect(self.update_install_status)
+            checkbox.toggled.connect(self._on_install_toggle)
+        
+        # Coalesce bursts of checkbox toggles into one status update
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(0)
+        self._status_timer.timeout.connect(self._recompute_install_status)
         
         simulate_install_button = QPushButton("Simulate Installation")
         simulate_install_button.clicked.connect(self.simulate_installation)
@@ -171,7 +277,7 @@ class RemoteAccessModule(TrainingModule):
         remote_test_layout = QHBoxLayout()
         remote_test_layout.addWidget(QLabel("Remote IP:"))
         self.remote_ip_input = QLineEdit()
-        self.remote_ip_input.setPlaceholderText("Enter remote PC IP")
+        self.remote_ip_input.setPlaceholderText("Enter remote PC IP (comma-separated for several)")
         remote_test_layout.addWidget(self.remote_ip_input)
         test_layout.addLayout(remote_test_layout)
         
@@ -188,35 +294,47 @@ class RemoteAccessModule(TrainingModule):
         test_group.setLayout(test_layout)
         layout.addWidget(test_group)
         
-        # Teams Configuration section (optional)
-        teams_group = QGroupBox("Microsoft Teams Configuration (Optional)")
-        teams_layout = QVBoxLayout()
+        # History and the optional Teams setup share a tab widget; each page
+        # is built the first time its tab is shown
+        extras_tabs = QTabWidget()
+        extras_tabs.addTab(LazySection(self._build_history_section), "Connection History")
+        extras_tabs.addTab(LazySection(self._build_teams_section),
+                           "Microsoft Teams Configuration (Optional)")
+        layout.addWidget(extras_tabs)
+        
+        config = self.vnc_config
+        if config:
+            self.vnc_port_spin.setValue(config.get('port', self.vnc_port_spin.value()))
+            self.display_combo.setCurrentText(
+                config.get('display', self.display_combo.currentText()))
+            self.loopback_check.setChecked(
+                config.get('loopback', self.loopback_check.isChecked()))
+            self.all_interfaces_check.setChecked(
+                config.get('all_interfaces', self.all_interfaces_check.isChecked()))
+    
+    def _build_teams_section(self, container):
+        """Build the Teams configuration checklist"""
+        teams_layout = QVBoxLayout(container)
         
         teams_info_label = QLabel("Configure Teams for additional remote support:")
         teams_info_label.setWordWrap(True)
         teams_layout.addWidget(teams_info_label)
         
-        self.teams_checklist = {
-            'teams_installed': QCheckBox("Teams installed and logged in"),
-            'camera_configured': QCheckBox("Camera configured"),
-            'microphone_configured': QCheckBox("Microphone configured"),
-            'screen_sharing_tested': QCheckBox("Screen sharing tested"),
-            'remote_control_enabled': QCheckBox("Remote control permissions set")
-        }
+        self._teams_keys = tuple(key for key, _ in _TEAMS_STEPS)
+        self._teams_boxes = [QCheckBox(label) for _, label in _TEAMS_STEPS]
         
-        for step, checkbox in self.teams_checklist.items():
+        self._teams_total = len(self._teams_boxes)
+        for checkbox in self._teams_boxes:
             teams_layout.addWidget(checkbox)
+            checkbox.toggled.connect(self._on_teams_toggle)
         
         teams_test_button = QPushButton("Test Teams Configuration")
         teams_test_button.clicked.connect(self.test_teams_config)
         teams_layout.addWidget(teams_test_button)
-        
-        teams_group.setLayout(teams_layout)
-        layout.addWidget(teams_group)
-        
-        # Connection History
-        history_group = QGroupBox("Connection History")
-        history_layout = QVBoxLayout()
+    
+    def _build_history_section(self, container):
+        """Build the connection history table"""
+        history_layout = QVBoxLayout(container)
         
         self.history_table = QTableWidget()
         self.history_table.setColumnCount(4)
@@ -230,20 +348,110 @@ class RemoteAccessModule(TrainingModule):
         clear_history_button.clicked.connect(self.clear_connection_history)
         history_layout.addWidget(clear_history_button)
         
-        history_group.setLayout(history_layout)
-        layout.addWidget(history_group)
+        # Entries recorded before the table existed
+        self._show_history_rows(self.connection_history)
+    
+    def _load_state(self):
+        """Restore VNC config and connection history saved by a previous run"""
+        local_ok = remote_ok = False
+        try:
+            with open(self._state_path, encoding='utf-8') as f:
+                state = json.load(f)
+            if not isinstance(state, dict):
+                raise TypeError("state must be an object")
+            
+            vnc_config = state.get('vnc_config', {})
+            if not isinstance(vnc_config, dict):
+                raise TypeError("vnc_config must be an object")
+            password_ok = state.get('vnc_password_ok') is True
+            
+            history = []
+            for entry in state.get('history', []):
+                conn_type, ip, status = entry['type'], entry['ip'], entry['status']
+                if not all(isinstance(value, str) for value in (conn_type, ip, status)):
+                    raise TypeError("history fields must be strings")
+                history.append({
+                    'time': datetime.fromisoformat(entry['time']),
+                    'type': conn_type,
+                    'ip': ip,
+                    'status': status
+                })
+                if conn_type == "VNC Test" and status == "Success":
+                    if ip == "localhost":
+                        local_ok = True
+                    else:
+                        remote_ok = True
+        except (OSError, ValueError, KeyError, TypeError):
+            # Missing, corrupt or outdated state; start fresh
+            return
+        
+        # Drop settings of the wrong type so restoring the widgets cannot fail
+        self.vnc_config = {
+            key: value for key, value in vnc_config.items()
+            if isinstance(value, _VNC_CONFIG_TYPES.get(key, ()))
+        }
+        self.connection_history = history[-_HISTORY_LIMIT:]
+        self._vnc_password_ok = password_ok
+        self._local_ok = local_ok
+        self._remote_ok = remote_ok
+    
+    def _schedule_save(self):
+        """Coalesce state changes into one write shortly after the last one"""
+        if self._save_timer is None:
+            self._save_timer = QTimer(self)
+            self._save_timer.setSingleShot(True)
+            self._save_timer.setInterval(1000)
+            self._save_timer.timeout.connect(self._save_state)
+        self._save_timer.start()
+    
+    def _save_state(self):
+        """Write VNC config and connection history to disk"""
+        state = {
+            'vnc_config': {key: value for key, value in self.vnc_config.items()
+                           if key in _VNC_CONFIG_TYPES},
+            'vnc_password_ok': self._vnc_password_ok,
+            'history': [dict(entry, time=entry['time'].isoformat())
+                        for entry in self.connection_history]
+        }
+        try:
+            self._state_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._state_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+        except OSError:
+            # Persistence is best effort; the in-memory state is still valid
+            pass
+    
+    def shutdown(self):
+        """Write any pending state before the module window closes"""
+        if self._save_timer is not None and self._save_timer.isActive():
+            self._save_timer.stop()
+            self._save_state()
+        super().shutdown()
+    
+    def _on_install_toggle(self, checked):
+        """Keep the checked installation step count in sync"""
+        self._install_checked_count += 1 if checked else -1
+        self.update_install_status()
+    
+    def _on_teams_toggle(self, checked):
+        """Keep the checked Teams step count in sync"""
+        self._teams_checked_count += 1 if checked else -1
     
     def update_install_status(self):
+        """Schedule an installation status refresh"""
+        self._status_timer.start()
+    
+    def _recompute_install_status(self):
         """Update installation status based on checklist"""
-        all_checked = all(cb.isChecked() for cb in self.install_checklist.values())
-        if all_checked:
+        if self._install_checked_count == self._install_total:
             self.install_status_label.setText("Installed")
             self.install_status_label.setStyleSheet("font-weight: bold; color: #27ae60;")
-            self.task_widgets.get("install_vnc_server").set_completed(True)
+            if self._tw_install_vnc:
+                self._tw_install_vnc.set_completed(True)
     
     def simulate_installation(self):
         """Simulate VNC installation process"""
-        steps = [
+        self._install_steps = [
             "Downloading UltraVNC installer...",
             "Launching installer with admin privileges...",
             "Installing VNC Server component...",
@@ -251,16 +459,34 @@ class RemoteAccessModule(TrainingModule):
             "Configuring firewall exception...",
             "Installation complete!"
         ]
+        self._install_idx = 0
         
-        for i, step in enumerate(steps):
-            QTimer.singleShot(i * 500, lambda s=step: self.connection_status_text.append(s))
+        if self._install_timer is None:
+            self._install_timer = QTimer(self)
+            self._install_timer.setInterval(500)
+            self._install_timer.timeout.connect(self._tick_install)
         
-        QTimer.singleShot(len(steps) * 500, self.installation_complete)
+        # First step is shown immediately, the rest on each 500 ms tick
+        self._tick_install()
+        self._install_timer.start()
+    
+    def _tick_install(self):
+        """Show the next simulated installation step"""
+        if self._install_idx == len(self._install_steps):
+            self._install_timer.stop()
+            self.installation_complete()
+            return
+        
+        self.connection_status_text.append(self._install_steps[self._install_idx])
+        self._install_idx += 1
     
     def installation_complete(self):
         """Handle installation completion"""
-        for checkbox in self.install_checklist.values():
-            checkbox.setChecked(True)
+        for checkbox in self._install_boxes:
+            with QSignalBlocker(checkbox):
+                checkbox.setChecked(True)
+        self._install_checked_count = self._install_total
+        self._recompute_install_status()
         
         QMessageBox.information(self, "Installation Complete",
                               "UltraVNC has been successfully installed.")
@@ -275,26 +501,53 @@ class RemoteAccessModule(TrainingModule):
             'loopback': self.loopback_check.isChecked(),
             'all_interfaces': self.all_interfaces_check.isChecked()
         }
+        self._vnc_password_ok = self.vnc_config['password'] == 'ae746'
+        self._schedule_save()
         
         # Verify password
-        if self.vnc_config['password'] != 'ae746':
+        if not self._vnc_password_ok:
             QMessageBox.warning(self, "Password Mismatch",
                               "Please use the standard Broetje password: ae746")
             return
         
-        self.task_widgets.get("configure_vnc_password").set_completed(True)
-        self.task_widgets.get("network_configuration").set_completed(True)
+        if self._tw_vnc_password:
+            self._tw_vnc_password.set_completed(True)
+        if self._tw_network_config:
+            self._tw_network_config.set_completed(True)
         
         QMessageBox.information(self, "Configuration Applied",
                               "VNC server configuration has been applied.")
     
     def detect_server_ip(self):
         """Detect server IP address"""
-        # Simulated IP detection
-        import random
-        network_prefix = "192.168.214"
-        host = random.randint(30, 40)
-        self.server_ip_label.setText(f"{network_prefix}.{host}")
+        # Reuse a recent result so repeated clicks don't redo the lookup
+        now = time.monotonic()
+        cached = self._server_ip_cache
+        if cached and now - cached[0] < _SERVER_IP_CACHE_TTL:
+            self.server_ip_label.setText(cached[1])
+            return
+        
+        ip = self._lookup_server_ip()
+        if ip is None:
+            # Simulated IP detection
+            network_prefix = "192.168.214"
+            host = random.randint(30, 40)
+            ip = f"{network_prefix}.{host}"
+        
+        self._server_ip_cache = (now, ip)
+        self.server_ip_label.setText(ip)
+    
+    @staticmethod
+    def _lookup_server_ip():
+        """Return the address of the interface facing the machine network"""
+        try:
+            # Connecting a UDP socket only picks a route; nothing is sent
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                sock.connect((_MACHINE_NETWORK_GATEWAY, 9))
+                ip = sock.getsockname()[0]
+        except OSError:
+            return None
+        return None if ip.startswith("127.") or ip == "0.0.0.0" else ip
     
     def test_local_connection(self):
         """Test local VNC connection"""
@@ -309,44 +562,69 @@ class RemoteAccessModule(TrainingModule):
     
     def test_remote_connection(self):
         """Test remote VNC connection"""
-        remote_ip = self.remote_ip_input.text().strip()
-        if not remote_ip:
+        remote_ips = self.remote_ip_input.text().replace(",", " ").split()
+        if not remote_ips:
             QMessageBox.warning(self, "No IP Address",
                               "Please enter a remote IP address.")
             return
         
-        self.connection_status_text.append(
-            f"Testing remote connection to {remote_ip}:{self.vnc_port_spin.value()}..."
-        )
-        
-        # Simulate connection test
-        QTimer.singleShot(1500, lambda: self.connection_test_result(
-            remote_ip, self.vnc_port_spin.value(), True
-        ))
+        self.probe_hosts(remote_ips, self.vnc_port_spin.value())
+    
+    def probe_hosts(self, ips, port):
+        """Probe several hosts at once; total wait is the slowest probe, not the sum"""
+        for ip in ips:
+            self.connection_status_text.append(
+                f"Testing remote connection to {ip}:{port}..."
+            )
+            self._probe_tcp(ip, port)
+    
+    def _probe_tcp(self, ip, port, timeout_ms=2000):
+        """Try a TCP connect without blocking the event loop"""
+        sock = QTcpSocket(self)
+        timer = QTimer(sock)
+        timer.setSingleShot(True)
+        timer.setInterval(timeout_ms)
+        
+        def finish(success):
+            # Whichever of connected/error/timeout fires first wins
+            timer.stop()
+            sock.blockSignals(True)
+            sock.abort()
+            sock.deleteLater()
+            self.connection_test_result(ip, port, success)
+        
+        sock.connected.connect(lambda: finish(True))
+        sock.errorOccurred.connect(lambda error: finish(False))
+        timer.timeout.connect(lambda: finish(False))
+        
+        timer.start()
+        sock.connectToHost(ip, port)
     
     def connection_test_result(self, ip, port, success):
         """Handle connection test result"""
         status = "Success" if success else "Failed"
-        color = "#27ae60" if success else "#e74c3c"
         
         self.connection_status_text.append(
-            f'<span style="color: {color};">Connection to {ip}:{port} - {status}</span>'
+            (_OK_HTML if success else _FAIL_HTML).format(ip, port)
         )
         
         # Add to history
         self.add_connection_history(ip, f"VNC Test", status)
         
         if success and ip == "localhost":
-            self.task_widgets.get("test_local_connection").set_completed(True)
+            self._local_ok = True
+            if self._tw_local_test:
+                self._tw_local_test.set_completed(True)
         elif success and ip != "localhost":
-            self.task_widgets.get("remote_connection_test").set_completed(True)
+            self._remote_ok = True
+            if self._tw_remote_test:
+                self._tw_remote_test.set_completed(True)
     
     def test_teams_config(self):
         """Test Teams configuration"""
-        all_checked = all(cb.isChecked() for cb in self.teams_checklist.values())
-        
-        if all_checked:
-            self.task_widgets.get("teams_configuration").set_completed(True)
+        if self._teams_checked_count == self._teams_total:
+            if self._tw_teams_config:
+                self._tw_teams_config.set_completed(True)
             QMessageBox.information(self, "Teams Configuration",
                                   "Microsoft Teams is properly configured for remote support.")
             self.add_connection_history("Teams", "Configuration Test", "Success")
@@ -354,100 +632,107 @@ class RemoteAccessModule(TrainingModule):
             QMessageBox.warning(self, "Teams Configuration",
                               "Please complete all Teams configuration steps.")
     
-    def add_connection_history(self, ip, conn_type, status):
-        """Add entry to connection history"""
-        row = self.history_table.rowCount()
-        self.history_table.insertRow(row)
-        
-        time_item = QTableWidgetItem(datetime.now().strftime("%H:%M:%S"))
+    def _fill_history_row(self, row, when, conn_type, ip, status):
+        """Populate one row of the history table"""
+        time_item = QTableWidgetItem(when.strftime("%H:%M:%S"))
         type_item = QTableWidgetItem(conn_type)
         ip_item = QTableWidgetItem(ip)
         status_item = QTableWidgetItem(status)
         
-        if status == "Success":
-            status_item.setForeground(Qt.green)
-        else:
-            status_item.setForeground(Qt.red)
+        status_item.setForeground(_OK_BRUSH if status == "Success" else _FAIL_BRUSH)
         
         self.history_table.setItem(row, 0, time_item)
         self.history_table.setItem(row, 1, type_item)
         self.history_table.setItem(row, 2, ip_item)
         self.history_table.setItem(row, 3, status_item)
+    
+    def add_connection_history(self, ip, conn_type, status):
+        """Add entry to connection history"""
+        now = datetime.now()
+        if self.history_table is not None:
+            # Repaint once after the whole row is filled, not per cell
+            self.history_table.setUpdatesEnabled(False)
+            self.history_table.blockSignals(True)
+            
+            # Oldest row drops off once the table is full
+            if self.history_table.rowCount() >= _HISTORY_LIMIT:
+                self.history_table.removeRow(0)
+            
+            row = self.history_table.rowCount()
+            self.history_table.insertRow(row)
+            self._fill_history_row(row, now, conn_type, ip, status)
+            
+            self.history_table.blockSignals(False)
+            self.history_table.setUpdatesEnabled(True)
+            self.history_table.viewport().update()
         
         # Store in history
         self.connection_history.append({
-            'time': datetime.now(),
+            'time': now,
             'type': conn_type,
             'ip': ip,
             'status': status
         })
+        del self.connection_history[:-_HISTORY_LIMIT]
+        self._schedule_save()
+    
+    def _show_history_rows(self, entries):
+        """Append history entries to the table with a single resize"""
+        if not entries or self.history_table is None:
+            return
+        entries = entries[-_HISTORY_LIMIT:]
+        
+        self.history_table.setUpdatesEnabled(False)
+        self.history_table.blockSignals(True)
+        
+        excess = self.history_table.rowCount() + len(entries) - _HISTORY_LIMIT
+        for _ in range(max(excess, 0)):
+            self.history_table.removeRow(0)
+        
+        row = self.history_table.rowCount()
+        self.history_table.setRowCount(row + len(entries))
+        for offset, entry in enumerate(entries):
+            self._fill_history_row(row + offset, entry['time'], entry['type'],
+                                   entry['ip'], entry['status'])
+        
+        self.history_table.blockSignals(False)
+        self.history_table.setUpdatesEnabled(True)
+        self.history_table.viewport().update()
     
     def clear_connection_history(self):
         """Clear connection history"""
-        self.history_table.setRowCount(0)
+        if self.history_table is not None:
+            self.history_table.setRowCount(0)
         self.connection_history.clear()
+        self._local_ok = False
+        self._remote_ok = False
+        self._schedule_save()
     
     def validate_task(self, task_id: str) -> bool:
         """Validate specific task completion"""
         if task_id == "install_vnc_server":
-            return all(cb.isChecked() for cb in self.install_checklist.values())
+            return self._install_checked_count == self._install_total
         
         elif task_id == "configure_vnc_password":
-            return self.vnc_config.get('password') == 'ae746'
+            return self._vnc_password_ok
         
         elif task_id == "network_configuration":
             return bool(self.vnc_config)
         
         elif task_id == "test_local_connection":
-            return any(h['type'] == "VNC Test" and h['ip'] == "localhost" 
-                      and h['status'] == "Success" for h in self.connection_history)
+            return self._local_ok
         
         elif task_id == "remote_connection_test":
-            return any(h['type'] == "VNC Test" and h['ip'] != "localhost" 
-                      and h['status'] == "Success" for h in self.connection_history)
+            return self._remote_ok
         
         elif task_id == "teams_configuration":
-            return all(cb.isChecked() for cb in self.teams_checklist.values())
+            return self._teams_checked_count == self._teams_total
         
         return True
     
     def get_additional_resources(self):
         """Get additional resources for this module"""
-        return {
-            "documents": [
-                {
-                    "title": "Remote Access Guide",
-                    "path": "resources/remote_access_guide.md",
-                    "type": "markdown"
-                }
-            ],
-            "links": [
-                {
-                    "title": "UltraVNC Documentation",
-                    "url": "https://uvnc.com/docs/",
-                    "description": "Official UltraVNC documentation"
-                },
-                {
-                    "title": "Teams Remote Control",
-                    "url": "https://support.microsoft.com/en-us/office/share-your-screen-in-a-teams-meeting",
-                    "description": "Microsoft Teams screen sharing guide"
-                }
-            ],
-            "tips": [
-                "Always use strong passwords for VNC",
-                "Configure firewall exceptions properly",
-                "Test connections before field deployment",
-                "Document all remote access configurations",
-                "Consider using VPN for extra security",
-                "Keep VNC software updated"
-            ],
-            "troubleshooting": {
-                "Connection refused": "Check firewall settings and VNC service status",
-                "Authentication failed": "Verify password is correct (ae746)",
-                "Black screen": "Check display settings and user permissions",
-                "Slow performance": "Adjust color depth and encoding settings"
-            }
-        }
+        return _RESOURCES
 
 # Export the module class
 MODULE_CLASS = RemoteAccessModule
\ No newline at end of file
@@ -118,6 +118,54 @@ def test_alternative_class_names():
         logger.error("✗ Failed to find alternative class")
         return False
 
+def test_module_reload_cache():
+    """Test that rescans only re-execute module.py files that changed on disk"""
+    logger.info("\n=== Testing Module Reload Cache ===")
+    import os
+    import json
+    import tempfile
+    from modules.module_loader import ModuleLoader as PackageModuleLoader
+    
+    module_id = "reload_cache_probe"
+    mod_name = f"modules.{module_id}"
+    try:
+        with tempfile.TemporaryDirectory() as modules_dir:
+            module_dir = Path(modules_dir, module_id)
+            module_dir.mkdir()
+            (module_dir / "metadata.json").write_text(
+                json.dumps({'id': module_id, 'name': "Reload Cache Probe"}))
+            module_py = module_dir / "module.py"
+            module_py.write_text("class ProbeModule:\n    version = 1\nMODULE_CLASS = ProbeModule\n")
+            
+            loader = PackageModuleLoader(modules_dir)
+            first = loader.scan_modules()[module_id].module_class
+            
+            # Unchanged file: the second scan must reuse the loaded class
+            if loader.scan_modules()[module_id].module_class is not first:
+                logger.error("✗ Unchanged module was re-executed")
+                return False
+            
+            # Changed file: a newer mtime must trigger a re-exec
+            module_py.write_text("class ProbeModule:\n    version = 2\nMODULE_CLASS = ProbeModule\n")
+            stat = module_py.stat()
+            os.utime(module_py, (stat.st_atime, stat.st_mtime + 10))
+            second = loader.scan_modules()[module_id].module_class
+            if second is first or second.version != 2:
+                logger.error("✗ Changed module was not re-executed")
+                return False
+            
+            # Broken edit: the last working version must stay loaded
+            module_py.write_text("class ProbeModule(:\n")
+            os.utime(module_py, (stat.st_atime, stat.st_mtime + 20))
+            if loader.scan_modules()[module_id].module_class is not second:
+                logger.error("✗ Failed reload discarded the working module")
+                return False
+        
+        logger.info("✓ Rescans reuse unchanged modules and reload changed ones")
+        return True
+    finally:
+        sys.modules.pop(mod_name, None)
+
 def test_module_in_database():
     """Test adding the module to the database"""
     logger.info("\n=== Testing Database Integration ===")
@@ -152,6 +200,7 @@ def main():
         ("Direct Import", test_direct_import),
         ("Module Loader", test_module_loader),
         ("Alternative Class Names", test_alternative_class_names),
+        ("Module Reload Cache", test_module_reload_cache),
         ("Database Integration", test_module_in_database)
     ]
     
@@ -33,4 +33,84 @@ for module_name in modules:
         else:
             print(f"✗ Module failed to load")
     except Exception as e:
-        print(f"✗ Error loading module: {e}")
\ No newline at end of file
+        print(f"✗ Error loading module: {e}")
+
+# Closing a module window must shut the module down through TrainingModule.shutdown
+print("\nTesting module window shutdown")
+try:
+    from PySide6.QtWidgets import QApplication, QMainWindow
+    from PySide6.QtGui import QCloseEvent
+    app = QApplication.instance() or QApplication(sys.argv)
+    
+    from module_window import ModuleWindow
+    from modules.test_import_module.module import TestImportModule
+    
+    module = TestImportModule()
+    cleanup_calls = []
+    module.cleanup = lambda: cleanup_calls.append(True)
+    
+    # Skip ModuleWindow.__init__, which needs a database and shows the window
+    window = ModuleWindow.__new__(ModuleWindow)
+    QMainWindow.__init__(window)
+    window.training_module = module
+    window.closeEvent(QCloseEvent())
+    
+    if module.elapsed_timer.isActive():
+        print("✗ Elapsed timer still running after close")
+    elif cleanup_calls:
+        print("✗ Module's own cleanup() was called on close")
+    else:
+        print("✓ Closing the window stopped the module")
+except Exception as e:
+    print(f"✗ Error testing module window shutdown: {e}")
+
+
+# Remote access state must round-trip without passwords and ignore corrupt files
+print("\nTesting remote access saved state")
+try:
+    import json
+    import tempfile
+    from datetime import datetime
+    from types import SimpleNamespace
+    from pathlib import Path
+    from PySide6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication(sys.argv)
+    
+    from modules.remote_access.module import RemoteAccessModule
+    
+    with tempfile.TemporaryDirectory() as data_dir:
+        db_manager = SimpleNamespace(db_path=str(Path(data_dir, "training_data.db")))
+        module_data = {'id': 'remote_access', 'name': 'Remote Access Configuration'}
+        user_data = {'id': 1}
+        
+        module = RemoteAccessModule(module_data, user_data, db_manager)
+        module.vnc_config = {'password': 'ae746', 'view_password': 'view', 'port': 5901,
+                             'display': ':1', 'loopback': True, 'all_interfaces': False}
+        module._vnc_password_ok = True
+        module.connection_history = [
+            {'time': datetime.now(), 'type': "VNC Test", 'ip': "localhost", 'status': "Success"},
+            {'time': datetime.now(), 'type': "VNC Test", 'ip': "10.0.0.5", 'status': "Failed"},
+        ]
+        module._save_state()
+        
+        saved = module._state_path.read_text(encoding='utf-8')
+        restored = RemoteAccessModule(module_data, user_data, db_manager)
+        if 'ae746' in saved or 'view' in saved:
+            print("✗ VNC passwords were written to disk")
+        elif not (restored.vnc_config.get('port') == 5901
+                  and len(restored.connection_history) == 2
+                  and restored.validate_task("configure_vnc_password")
+                  and restored.validate_task("test_local_connection")
+                  and not restored.validate_task("remote_connection_test")):
+            print("✗ Saved state did not round-trip")
+        else:
+            print("✓ Saved state round-trips without passwords")
+        
+        module._state_path.write_text(json.dumps({'history': [{'type': 1}]}), encoding='utf-8')
+        corrupt = RemoteAccessModule(module_data, user_data, db_manager)
+        if corrupt.connection_history or corrupt.vnc_config:
+            print("✗ Corrupt state file was not rejected")
+        else:
+            print("✓ Corrupt state file is ignored")
+except Exception as e:
+    print(f"✗ Error testing remote access saved state: {e}")
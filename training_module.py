@@ -169,6 +169,28 @@ class DigitalSignaturePad(QWidget):
         # Return base64 encoded signature
         return base64.b64encode(buffer.getvalue()).decode('utf-8')
 
+class LazySection(QWidget):
+    """Container whose contents are built the first time it is shown"""
+    
+    def __init__(self, builder):
+        super().__init__()
+        self._builder = builder
+    
+    @classmethod
+    def in_group_box(cls, title, builder):
+        """Wrap a lazy section in a titled group box"""
+        group = QGroupBox(title)
+        layout = QVBoxLayout(group)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(cls(builder))
+        return group
+    
+    def showEvent(self, event):
+        if self._builder is not None:
+            builder, self._builder = self._builder, None
+            builder(self)
+        super().showEvent(event)
+
 class TrainingModule(QWidget):
     """Base class for training modules"""
     module_completed = Signal(str, dict)
@@ -410,6 +432,10 @@ class TrainingModule(QWidget):
         minutes, seconds = divmod(remainder, 60)
         self.elapsed_time_label.setText(f"{hours:02d}:{minutes:02d}:{seconds:02d}")
     
+    def shutdown(self):
+        """Release resources held by the module; called when its window closes"""
+        self.elapsed_timer.stop()
+    
     def complete_module(self):
         """Complete the module"""
         # Validate completion